@@ -6,7 +6,6 @@ Social Media Intelligence, Web Analysis, and more
 
 import requests
 import json
-import time
 import re
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
@@ -16,6 +15,7 @@ import socket
 from datetime import datetime
 import subprocess
 import os
+import concurrent.futures
 
 # Rich imports
 from rich.console import Console
@@ -25,12 +25,23 @@ from rich.text import Text
 from rich.progress import track
 from rich.prompt import Prompt, Confirm
 
+# Framework fingerprints live in <head> or early <body>, so technology
+# detection only scans the first 256 KB of a page
+TECH_SCAN_LIMIT = 256 * 1024
+
+# Phrases that mark a 200 response as a missing profile
+NOT_FOUND_RE = re.compile(
+    r'user not found|page not found|profile not found|account suspended|user does not exist'
+)
+
+
 class ExtendedOSINT:
     def __init__(self, parent):
         self.parent = parent
         self.console = parent.console
         self.config = parent.config
         self.save_result = parent.save_result
+        self.session = parent.session
     
     def email_investigation_menu(self):
         """Email investigation submenu"""
@@ -309,20 +320,36 @@ class ExtendedOSINT:
             results = []
             
             with self.console.status("[bold green]Checking platforms..."):
-                for platform, url in track(platforms.items(), description="Searching platforms..."):
-                    try:
-                        response = requests.get(url, timeout=5, allow_redirects=True)
-                        if response.status_code == 200:
-                            # Simple heuristic to check if profile exists
-                            if not any(phrase in response.text.lower() for phrase in 
-                                     ['user not found', 'page not found', 'profile not found', 
-                                      'account suspended', 'user does not exist']):
-                                results.append({
-                                    "platform": platform,
-                                    "url": url,
-                                    "status": "Found",
-                                    "status_code": response.status_code
-                                })
+                with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+                    future_to_platform = {
+                        executor.submit(self.session.get, url, timeout=5, allow_redirects=True): (platform, url)
+                        for platform, url in platforms.items()
+                    }
+                    
+                    for future in track(
+                        concurrent.futures.as_completed(future_to_platform),
+                        description="Searching platforms...",
+                        total=len(future_to_platform)
+                    ):
+                        platform, url = future_to_platform[future]
+                        try:
+                            response = future.result()
+                            if response.status_code == 200:
+                                # Simple heuristic to check if profile exists
+                                if not NOT_FOUND_RE.search(response.text.lower()):
+                                    results.append({
+                                        "platform": platform,
+                                        "url": url,
+                                        "status": "Found",
+                                        "status_code": response.status_code
+                                    })
+                                else:
+                                    results.append({
+                                        "platform": platform,
+                                        "url": url,
+                                        "status": "Not Found",
+                                        "status_code": response.status_code
+                                    })
                             else:
                                 results.append({
                                     "platform": platform,
@@ -330,22 +357,17 @@ class ExtendedOSINT:
                                     "status": "Not Found",
                                     "status_code": response.status_code
                                 })
-                        else:
+                        except Exception:
                             results.append({
                                 "platform": platform,
                                 "url": url,
-                                "status": "Not Found",
-                                "status_code": response.status_code
+                                "status": "Error",
+                                "status_code": "N/A"
                             })
-                    except:
-                        results.append({
-                            "platform": platform,
-                            "url": url,
-                            "status": "Error",
-                            "status_code": "N/A"
-                        })
-                    
-                    time.sleep(0.1)  # Rate limiting
+            
+            # Keep the table in platform order regardless of completion order
+            platform_order = list(platforms)
+            results.sort(key=lambda result: platform_order.index(result["platform"]))
             
             # Display results
             results_table = Table(title=f"Username Search Results for '{username}'")
@@ -390,7 +412,7 @@ class ExtendedOSINT:
             with self.console.status("[bold green]Analyzing website..."):
                 response = requests.get(url, timeout=10)
                 headers = response.headers
-                content = response.text
+                content = response.text[:TECH_SCAN_LIMIT]
             
             # Analyze headers
             tech_info = {
@@ -404,7 +426,7 @@ class ExtendedOSINT:
             }
             
             # Analyze content for technologies
-            technologies = []
+            technologies = set()
             
             # Check for common frameworks and libraries
             tech_patterns = {
@@ -426,10 +448,8 @@ class ExtendedOSINT:
             }
             
             for tech, patterns in tech_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        technologies.append(tech)
-                        break
+                if any(re.search(pattern, content, re.IGNORECASE) for pattern in patterns):
+                    technologies.add(tech)
             
             # Create results table
             tech_table = Table(title="Technology Stack Information")
@@ -443,13 +463,13 @@ class ExtendedOSINT:
             
             if technologies:
                 self.console.print(f"\n[bold yellow]Detected Technologies:[/bold yellow]")
-                for tech in set(technologies):
+                for tech in sorted(technologies):
                     self.console.print(f"• {tech}")
             
             # Save results
             self.save_result("website_tech", url, {
                 "headers": dict(headers),
-                "detected_technologies": list(set(technologies)),
+                "detected_technologies": sorted(technologies),
                 "tech_info": tech_info
             })
             
@@ -469,8 +489,11 @@ class ExtendedOSINT:
             nm = nmap.PortScanner()
             
             with self.console.status("[bold green]Scanning ports..."):
-                # Scan common ports
-                nm.scan(target, ','.join(map(str, common_ports)), '-T4')
+                # Scan common ports; skip rDNS (-n) and host discovery (-Pn)
+                nm.scan(
+                    hosts=target,
+                    arguments=f"-n -Pn -T4 --min-rate 5000 --max-retries 1 -p{','.join(map(str, common_ports))}"
+                )
             
             # Process results
             scan_results = []
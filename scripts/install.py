@@ -8,17 +8,30 @@ import os
 import sys
 import subprocess
 import platform
-import json
+import shutil
+import hashlib
+import collections
+import concurrent.futures
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-console = Console()
+# Host facts, resolved once per run
+OS_NAME = platform.system()
+PY_VERSION = sys.version_info
+HOME = Path.home()
 
-def banner():
+# Repository root (this script lives in scripts/)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Persistent pip cache so re-runs reuse previously built wheels
+PIP_CACHE_DIR = HOME / ".kaliosint" / "cache" / "pip"
+
+# Hash of the last successfully installed requirements.txt
+REQUIREMENTS_HASH_FILE = HOME / ".kaliosint" / "cache" / "requirements.sha256"
+
+def banner(console):
     """Display installation banner"""
+    from rich.panel import Panel
+    
     banner_text = """
  ██╗  ██╗ █████╗ ██╗     ██╗ ██████╗ ███████╗██╗███╗   ██╗████████╗
  ██║ ██╔╝██╔══██╗██║     ██║██╔═══██╗██╔════╝██║████╗  ██║╚══██╔══╝
@@ -43,29 +56,38 @@ def banner():
 
 def check_python_version():
     """Check if Python version meets requirements"""
-    version = sys.version_info
+    version = PY_VERSION
     if version.major < 3 or (version.major == 3 and version.minor < 8):
-        console.print("[red]❌ Error: Python 3.8 or higher is required[/red]")
-        console.print(f"[yellow]Current version: {version.major}.{version.minor}.{version.micro}[/yellow]")
+        print("❌ Error: Python 3.8 or higher is required")
+        print(f"Current version: {version.major}.{version.minor}.{version.micro}")
         return False
     
-    console.print(f"[green]✅ Python {version.major}.{version.minor}.{version.micro} detected[/green]")
+    print(f"✅ Python {version.major}.{version.minor}.{version.micro} detected")
     return True
 
-def check_os():
+def is_kali_linux():
+    """Return True when /etc/os-release identifies Kali Linux"""
+    try:
+        os_release = platform.freedesktop_os_release()
+    except AttributeError:
+        # Python < 3.10 has no freedesktop_os_release()
+        # Only inspect ID= lines instead of lowercasing the whole file
+        with open("/etc/os-release") as f:
+            return any(line.startswith("ID=") and "kali" in line.lower() for line in f)
+    return os_release.get("ID", "").lower() == "kali"
+
+def check_os(console):
     """Check operating system compatibility"""
-    os_name = platform.system()
+    os_name = OS_NAME
     console.print(f"[cyan]🖥️  Operating System: {os_name}[/cyan]")
     
     if os_name == "Linux":
         try:
-            with open("/etc/os-release") as f:
-                content = f.read()
-                if "kali" in content.lower():
-                    console.print("[green]✅ Kali Linux detected - Optimal environment[/green]")
-                else:
-                    console.print("[yellow]⚠️  Non-Kali Linux detected - Should work fine[/yellow]")
-        except:
+            if is_kali_linux():
+                console.print("[green]✅ Kali Linux detected - Optimal environment[/green]")
+            else:
+                console.print("[yellow]⚠️  Non-Kali Linux detected - Should work fine[/yellow]")
+        except OSError:
             console.print("[yellow]⚠️  Linux distribution unknown[/yellow]")
     elif os_name == "Windows":
         console.print("[yellow]⚠️  Windows detected - Some features may be limited[/yellow]")
@@ -74,18 +96,29 @@ def check_os():
     
     return True
 
-def install_dependencies():
+def install_dependencies(console):
     """Install Python dependencies"""
+    from rich.markup import escape
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
     console.print("\n[bold cyan]📦 Installing Python dependencies...[/bold cyan]")
     
     try:
         # Read requirements file
-        requirements_file = Path(__file__).parent.parent / "requirements.txt"
+        requirements_file = PROJECT_ROOT / "requirements.txt"
         
         if not requirements_file.exists():
             console.print("[red]❌ requirements.txt not found[/red]")
             return False
         
+        # Key on the interpreter too, so a new venv or Python still installs
+        requirements_hash = hashlib.sha256(
+            sys.executable.encode() + b"\0" + requirements_file.read_bytes()
+        ).hexdigest()
+        if REQUIREMENTS_HASH_FILE.exists() and REQUIREMENTS_HASH_FILE.read_text().strip() == requirements_hash:
+            console.print("[green]✅ Dependencies unchanged since last install (cached, skipping)[/green]")
+            return True
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -93,27 +126,45 @@ def install_dependencies():
         ) as progress:
             task = progress.add_task("Installing packages...", total=None)
             
-            result = subprocess.run([
-                sys.executable, "-m", "pip", "install", "-r", str(requirements_file)
-            ], capture_output=True, text=True)
+            env = {**os.environ, "PIP_CACHE_DIR": str(PIP_CACHE_DIR), "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+            
+            # Make sure sdists are built into cacheable wheels
+            subprocess.run([
+                sys.executable, "-m", "pip", "install", "-q", "-U", "pip", "wheel"
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env)
             
-            if result.returncode == 0:
+            process = subprocess.Popen([
+                sys.executable, "-m", "pip", "install", "--prefer-binary", "--no-input",
+                "--disable-pip-version-check",
+                "--cache-dir", str(PIP_CACHE_DIR), "-r", str(requirements_file)
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, env=env)
+            
+            # Stream pip's output into the spinner, keeping only the tail for errors
+            output_tail = collections.deque(maxlen=20)
+            for line in process.stdout:
+                line = line.strip()
+                if line:
+                    output_tail.append(line)
+                    progress.update(task, description=escape(line[:80]))
+            
+            if process.wait() == 0:
+                REQUIREMENTS_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+                REQUIREMENTS_HASH_FILE.write_text(requirements_hash)
                 console.print("[green]✅ All dependencies installed successfully[/green]")
                 return True
             else:
-                console.print(f"[red]❌ Error installing dependencies: {result.stderr}[/red]")
+                console.print(f"[red]❌ Error installing dependencies: {escape(chr(10).join(output_tail))}[/red]")
                 return False
                 
     except Exception as e:
         console.print(f"[red]❌ Error during installation: {e}[/red]")
         return False
 
-def setup_directories():
+def setup_directories(console):
     """Create necessary directories"""
     console.print("\n[bold cyan]📁 Setting up directories...[/bold cyan]")
     
-    home_dir = Path.home()
-    kaliosint_dir = home_dir / ".kaliosint"
+    kaliosint_dir = HOME / ".kaliosint"
     
     directories = [
         kaliosint_dir,
@@ -125,50 +176,47 @@ def setup_directories():
     
     for directory in directories:
         try:
-            directory.mkdir(exist_ok=True)
-            console.print(f"[green]✅ Created: {directory}[/green]")
+            # A single mkdir per new path; only existing paths pay for a stat
+            directory.mkdir()
+        except FileExistsError:
+            # Also raced by install_dependencies creating the cache directory
+            if not directory.is_dir():
+                console.print(f"[red]❌ Error creating {directory}: exists and is not a directory[/red]")
+                return False
         except Exception as e:
             console.print(f"[red]❌ Error creating {directory}: {e}[/red]")
             return False
+        console.print(f"[green]✅ Created: {directory}[/green]")
     
     return True
 
-def setup_config():
+def setup_config(console):
     """Setup configuration files"""
     console.print("\n[bold cyan]⚙️  Setting up configuration...[/bold cyan]")
     
     try:
         # Copy default config
-        project_root = Path(__file__).parent.parent
-        config_source = project_root / "config" / "default_config.json"
+        config_source = PROJECT_ROOT / "config" / "default_config.json"
         
-        home_dir = Path.home()
-        config_dest = home_dir / ".kaliosint" / "config" / "config.json"
+        config_dest = HOME / ".kaliosint" / "config" / "config.json"
         
         if config_source.exists():
             config_dest.parent.mkdir(exist_ok=True)
             
             if not config_dest.exists():
-                with open(config_source) as f:
-                    config_data = json.load(f)
-                
-                with open(config_dest, 'w') as f:
-                    json.dump(config_data, f, indent=2)
+                # Plain byte copy - the template is used as-is
+                shutil.copyfile(config_source, config_dest)
                 
                 console.print(f"[green]✅ Configuration file created: {config_dest}[/green]")
             else:
                 console.print(f"[yellow]⚠️  Configuration already exists: {config_dest}[/yellow]")
         
         # Setup API keys template
-        api_template = project_root / "config" / "api_keys.json.template"
-        api_dest = home_dir / ".kaliosint" / "config" / "api_keys.json"
+        api_template = PROJECT_ROOT / "config" / "api_keys.json.template"
+        api_dest = HOME / ".kaliosint" / "config" / "api_keys.json"
         
         if api_template.exists() and not api_dest.exists():
-            with open(api_template) as f:
-                api_data = json.load(f)
-            
-            with open(api_dest, 'w') as f:
-                json.dump(api_data, f, indent=2)
+            shutil.copyfile(api_template, api_dest)
             
             console.print(f"[green]✅ API keys template created: {api_dest}[/green]")
         
@@ -178,25 +226,24 @@ def setup_config():
         console.print(f"[red]❌ Error setting up configuration: {e}[/red]")
         return False
 
-def create_launcher():
+def create_launcher(console):
     """Create launcher script"""
     console.print("\n[bold cyan]🚀 Creating launcher script...[/bold cyan]")
     
     try:
-        project_root = Path(__file__).parent.parent
         launcher_content = f"""#!/bin/bash
 # KaliOSINT Launcher Script
-cd "{project_root}"
+cd "{PROJECT_ROOT}"
 python main.py "$@"
 """
         
-        launcher_path = project_root / "kaliosint"
+        launcher_path = PROJECT_ROOT / "kaliosint"
         
         with open(launcher_path, 'w') as f:
             f.write(launcher_content)
         
         # Make executable on Unix systems
-        if platform.system() != "Windows":
+        if OS_NAME != "Windows":
             os.chmod(launcher_path, 0o755)
         
         console.print(f"[green]✅ Launcher created: {launcher_path}[/green]")
@@ -208,7 +255,7 @@ python main.py "$@"
         console.print(f"[red]❌ Error creating launcher: {e}[/red]")
         return False
 
-def final_setup():
+def final_setup(console):
     """Final setup tasks"""
     console.print("\n[bold cyan]🎯 Final setup...[/bold cyan]")
     
@@ -230,7 +277,15 @@ def final_setup():
 
 def main():
     """Main installation function"""
-    banner()
+    # Stdlib-only check first so unsupported interpreters never import Rich
+    if not check_python_version():
+        return
+    
+    from rich.console import Console
+    from rich.prompt import Confirm
+    
+    console = Console()
+    banner(console)
     
     console.print("[bold yellow]🔍 KaliOSINT Installation Wizard[/bold yellow]")
     console.print("This script will install KaliOSINT and its dependencies.\n")
@@ -242,32 +297,41 @@ def main():
     # Pre-installation checks
     console.print("\n[bold cyan]🔍 Pre-installation checks...[/bold cyan]")
     
-    if not check_python_version():
+    if not check_os(console):
         return
     
-    if not check_os():
-        return
-    
-    # Installation steps
-    steps = [
+    # Installation steps - pip is the slow one, so the local setup runs
+    # alongside it in a second thread
+    heavy_steps = [
         ("Installing dependencies", install_dependencies),
+    ]
+    local_steps = [
         ("Setting up directories", setup_directories),
         ("Configuring application", setup_config),
         ("Creating launcher", create_launcher),
     ]
     
-    for step_name, step_func in steps:
-        console.print(f"\n[bold cyan]📋 {step_name}...[/bold cyan]")
-        if not step_func():
+    def run_steps(steps):
+        for step_name, step_func in steps:
+            console.print(f"\n[bold cyan]📋 {step_name}...[/bold cyan]")
+            if not step_func(console):
+                return step_name
+        return None
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        failed_steps = [step for step in executor.map(run_steps, (heavy_steps, local_steps)) if step]
+    
+    if failed_steps:
+        for step_name in failed_steps:
             console.print(f"[red]❌ Failed at: {step_name}[/red]")
-            return
+        return
     
-    final_setup()
+    final_setup(console)
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Installation interrupted by user[/yellow]")
+        print("\nInstallation interrupted by user")
     except Exception as e:
-        console.print(f"\n[red]❌ Unexpected error: {e}[/red]")
+        print(f"\n❌ Unexpected error: {e}")
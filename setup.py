@@ -7,9 +7,22 @@ Automatically installs dependencies and sets up the OSINT environment
 import os
 import sys
 import subprocess
+import hashlib
+import shutil
 import platform
 from pathlib import Path
 
+# Host facts, resolved once per run
+OS_NAME = platform.system()
+PY_VERSION = sys.version_info
+HOME = Path.home()
+
+# Persistent pip cache so re-runs reuse previously built wheels
+PIP_CACHE_DIR = HOME / ".kaliosint" / "cache" / "pip"
+
+# Hash of the last successfully installed requirements.txt
+REQUIREMENTS_HASH_FILE = HOME / ".kaliosint" / "cache" / "requirements.sha256"
+
 def print_banner():
     """Print installation banner"""
     banner = """
@@ -25,7 +38,7 @@ def print_banner():
 
 def check_python_version():
     """Check if Python version is compatible"""
-    version = sys.version_info
+    version = PY_VERSION
     if version.major < 3 or (version.major == 3 and version.minor < 8):
         print("❌ Error: Python 3.8 or higher is required")
         print(f"Current version: {version.major}.{version.minor}.{version.micro}")
@@ -33,21 +46,30 @@ def check_python_version():
     else:
         print(f"✅ Python version: {version.major}.{version.minor}.{version.micro}")
 
+def is_kali_linux():
+    """Return True when /etc/os-release identifies Kali Linux"""
+    try:
+        os_release = platform.freedesktop_os_release()
+    except AttributeError:
+        # Python < 3.10 has no freedesktop_os_release()
+        # Only inspect ID= lines instead of lowercasing the whole file
+        with open("/etc/os-release") as f:
+            return any(line.startswith("ID=") and "kali" in line.lower() for line in f)
+    return os_release.get("ID", "").lower() == "kali"
+
 def check_os():
     """Check operating system"""
-    os_name = platform.system()
+    os_name = OS_NAME
     print(f"🖥️  Operating System: {os_name}")
     
     if os_name == "Linux":
         # Check if it's Kali Linux
         try:
-            with open('/etc/os-release', 'r') as f:
-                content = f.read()
-                if 'kali' in content.lower():
-                    print("✅ Kali Linux detected - optimal environment!")
-                else:
-                    print("⚠️  Not Kali Linux - some tools may need manual installation")
-        except:
+            if is_kali_linux():
+                print("✅ Kali Linux detected - optimal environment!")
+            else:
+                print("⚠️  Not Kali Linux - some tools may need manual installation")
+        except OSError:
             print("⚠️  Could not detect Linux distribution")
     elif os_name == "Windows":
         print("⚠️  Windows detected - some features may be limited")
@@ -58,41 +80,44 @@ def install_python_packages():
     """Install required Python packages"""
     print("\n📦 Installing Python packages...")
     
-    packages = [
-        "requests>=2.28.0",
-        "beautifulsoup4>=4.11.0",
-        "colorama>=0.4.6",
-        "rich>=13.0.0",
-        "click>=8.1.0",
-        "python-whois>=0.8.0",
-        "dnspython>=2.3.0",
-        "shodan>=1.28.0",
-        "phonenumbers>=8.13.0",
-        "python-nmap>=0.7.1",
-        "feedparser>=6.0.10",
-        "pyfiglet>=0.8.0",
-        "termcolor>=2.3.0",
-        "tabulate>=0.9.0",
-        "validators>=0.22.0",
-        "ipwhois>=1.2.0",
-        "matplotlib>=3.7.0",
-        "networkx>=3.1",
-        "plotly>=5.17.0"
-    ]
+    requirements_file = Path(__file__).parent / "requirements.txt"
+    if not requirements_file.exists():
+        print("❌ requirements.txt not found")
+        return
     
-    for package in packages:
-        try:
-            print(f"Installing {package.split('>=')[0]}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"✅ {package.split('>=')[0]} installed successfully")
-        except subprocess.CalledProcessError:
-            print(f"❌ Failed to install {package.split('>=')[0]}")
+    # Key on the interpreter too, so a new venv or Python still installs
+    requirements_hash = hashlib.sha256(
+        sys.executable.encode() + b"\0" + requirements_file.read_bytes()
+    ).hexdigest()
+    if REQUIREMENTS_HASH_FILE.exists() and REQUIREMENTS_HASH_FILE.read_text().strip() == requirements_hash:
+        print("✅ Python packages unchanged since last install (cached, skipping)")
+        return
+    
+    env = {**os.environ, "PIP_CACHE_DIR": str(PIP_CACHE_DIR)}
+    
+    # Make sure sdists are built into cacheable wheels
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-U", "pip", "wheel"], env=env)
+    except subprocess.CalledProcessError:
+        print("⚠️  Could not upgrade pip/wheel - continuing with the installed versions")
+    
+    # Resolve and install everything in a single pip run
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install", "--prefer-binary",
+            "--cache-dir", str(PIP_CACHE_DIR), "-r", str(requirements_file)
+        ], env=env)
+        REQUIREMENTS_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        REQUIREMENTS_HASH_FILE.write_text(requirements_hash)
+        print("✅ All Python packages installed successfully")
+    except subprocess.CalledProcessError:
+        print("❌ Failed to install Python packages from requirements.txt")
 
 def install_system_tools():
     """Install system tools (Linux/Kali specific)"""
     print("\n🔧 Checking system tools...")
     
-    if platform.system() == "Linux":
+    if OS_NAME == "Linux":
         tools = {
             "nmap": "Network scanning tool",
             "whois": "Domain lookup tool", 
@@ -104,20 +129,17 @@ def install_system_tools():
         }
         
         for tool, description in tools.items():
-            try:
-                result = subprocess.run(["which", tool], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"✅ {tool} is installed ({description})")
-                else:
-                    print(f"⚠️  {tool} not found - install with: apt install {tool}")
-            except:
-                print(f"❌ Could not check {tool}")
+            # shutil.which does the PATH lookup in-process, no fork/exec
+            if shutil.which(tool) is not None:
+                print(f"✅ {tool} is installed ({description})")
+            else:
+                print(f"⚠️  {tool} not found - install with: apt install {tool}")
 
 def create_config_structure():
     """Create configuration directory structure"""
     print("\n📁 Creating configuration structure...")
     
-    config_dir = Path.home() / ".kaliosint"
+    config_dir = HOME / ".kaliosint"
     results_dir = config_dir / "results"
     logs_dir = config_dir / "logs"
     
@@ -144,9 +166,14 @@ def create_config_structure():
                 "twitter_bearer": ""
             }
             
-            import json
-            with open(config_file, 'w') as f:
-                json.dump(default_config, f, indent=2)
+            # orjson encodes straight to bytes; fall back to the stdlib before it is installed
+            try:
+                import orjson
+                config_file.write_bytes(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
+            except ImportError:
+                import json
+                with open(config_file, 'w') as f:
+                    f.write(json.dumps(default_config, indent=2))
             
             print(f"✅ Default configuration created: {config_file}")
         
@@ -164,7 +191,7 @@ def setup_aliases():
         print(f"📍 KaliOSINT script location: {kaliosint_script}")
         
         # Bash alias
-        bashrc = Path.home() / ".bashrc"
+        bashrc = HOME / ".bashrc"
         alias_line = f'alias kaliosint="python3 {kaliosint_script}"\n'
         
         try:
@@ -172,7 +199,7 @@ def setup_aliases():
                 f.write(f"\n# KaliOSINT alias\n{alias_line}")
             print("✅ Bash alias added to ~/.bashrc")
             print("   Use 'kaliosint' command to start the tool")
-        except:
+        except OSError:
             print("⚠️  Could not add bash alias")
         
         # Create executable script
@@ -183,7 +210,7 @@ def setup_aliases():
             
             os.chmod(exe_script, 0o755)
             print(f"✅ Executable script created: {exe_script}")
-        except:
+        except OSError:
             print("⚠️  Could not create executable script")
 
 def print_completion_message():
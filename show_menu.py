@@ -6,16 +6,15 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich import box
 
-def show_menu():
-    console = Console()
-    
-    # Display banner
-    banner = """
+# The banner and feature summary are static, so their renderables are
+# built once at import
+_BANNER = """
     ██╗  ██╗ █████╗ ██╗     ██╗     ██████╗ ███████╗██╗███╗   ██╗████████╗
     ██║ ██╔╝██╔══██╗██║     ██║    ██╔═══██╗██╔════╝██║████╗  ██║╚══██╔══╝
     █████╔╝ ███████║██║     ██║    ██║   ██║███████╗██║██╔██╗ ██║   ██║   
@@ -27,44 +26,11 @@ def show_menu():
     📊 Open Source Intelligence Gathering Made Easy
     🛡️  Professional Grade Information Reconnaissance
     """
-    
-    console.print(Panel(banner, title="[bold cyan]KaliOSINT v1.0[/bold cyan]", 
-                       border_style="bright_blue", box=box.DOUBLE))
-    
-    # Create menu table
-    table = Table(title="🎯 OSINT Operations Menu", box=box.ROUNDED, 
-                  title_style="bold magenta")
-    table.add_column("Option", style="cyan", justify="center", width=8)
-    table.add_column("Category", style="green bold", width=20)
-    table.add_column("Description", style="white", width=50)
-    
-    menu_items = [
-        ("0", "🚪 Exit", "Exit the program"),
-        ("1", "🌐 Domain OSINT", "Comprehensive domain reconnaissance"),
-        ("2", "🖥️  IP Address OSINT", "IP address investigation and analysis"),
-        ("3", "📧 Email OSINT", "Email address investigation"),
-        ("4", "📱 Phone OSINT", "Phone number investigation"),
-        ("5", "👤 Username OSINT", "Username search across platforms"),
-        ("6", "🔍 Google Dorking", "Advanced Google search techniques"),
-        ("7", "🗂️  Metadata Analysis", "File metadata extraction"),
-        ("8", "🕷️  Web Crawling", "Website crawling and analysis"),
-        ("9", "🔗 Social Media OSINT", "Social media investigation"),
-        ("10", "🌊 Threat Intelligence", "Threat intelligence gathering"),
-        ("11", "🌐 Network Scanning", "Network discovery and scanning"),
-        ("12", "🔒 Crypto Investigation", "Cryptocurrency investigation"),
-        ("13", "🕳️  Dark Web Monitoring", "Dark web intelligence"),
-        ("14", "⚙️  Configuration", "Tool configuration and settings"),
-        ("15", "📊 Generate Report", "Generate investigation report")
-    ]
-    
-    for option, category, description in menu_items:
-        table.add_row(option, category, description)
-    
-    console.print(table)
-    
-    # Show features summary
-    features_panel = Panel(
-        """
+
+_BANNER_PANEL = Panel(Text.from_markup(_BANNER), title="[bold cyan]KaliOSINT v1.0[/bold cyan]",
+                      border_style="bright_blue", box=box.DOUBLE)
+
+_FEATURES = """
 🎯 [bold green]Key Features:[/bold green]
 • Multi-threaded scanning and reconnaissance
 • API integrations (VirusTotal, Shodan, etc.)
@@ -82,12 +48,62 @@ Then select an option from the menu above.
 📁 [bold blue]Results:[/bold blue]
 All investigation results are saved in the 'osint_results' directory
 with timestamped files for easy organization.
-        """,
-        title="[bold green]Tool Information[/bold green]",
-        border_style="green"
-    )
+        """
+
+_FEATURES_PANEL = Panel(Text.from_markup(_FEATURES), title="[bold green]Tool Information[/bold green]",
+                        border_style="green")
+
+# Menu rows as (option, category, description)
+_MENU_ITEMS = (
+    ("0", "🚪 Exit", "Exit the program"),
+    ("1", "🌐 Domain OSINT", "Comprehensive domain reconnaissance"),
+    ("2", "🖥️  IP Address OSINT", "IP address investigation and analysis"),
+    ("3", "📧 Email OSINT", "Email address investigation"),
+    ("4", "📱 Phone OSINT", "Phone number investigation"),
+    ("5", "👤 Username OSINT", "Username search across platforms"),
+    ("6", "🔍 Google Dorking", "Advanced Google search techniques"),
+    ("7", "🗂️  Metadata Analysis", "File metadata extraction"),
+    ("8", "🕷️  Web Crawling", "Website crawling and analysis"),
+    ("9", "🔗 Social Media OSINT", "Social media investigation"),
+    ("10", "🌊 Threat Intelligence", "Threat intelligence gathering"),
+    ("11", "🌐 Network Scanning", "Network discovery and scanning"),
+    ("12", "🔒 Crypto Investigation", "Cryptocurrency investigation"),
+    ("13", "🕳️  Dark Web Monitoring", "Dark web intelligence"),
+    ("14", "⚙️  Configuration", "Tool configuration and settings"),
+    ("15", "📊 Generate Report", "Generate investigation report"),
+)
+
+def _build_menu_table():
+    table = Table(title="🎯 OSINT Operations Menu", box=box.ROUNDED, 
+                  title_style="bold magenta")
+    table.add_column("Option", style="cyan", justify="center", width=8)
+    table.add_column("Category", style="green bold", width=20)
+    table.add_column("Description", style="white", width=50)
+    
+    for option, category, description in _MENU_ITEMS:
+        table.add_row(option, category, description)
+    
+    return table
+
+_MENU_TABLE = _build_menu_table()
+
+def _render_menu(console):
+    # Banner, menu and tool information in a single print
+    console.print(Group(_BANNER_PANEL, _MENU_TABLE, _FEATURES_PANEL))
+
+_MENU_CACHE = None
+
+def show_menu():
+    global _MENU_CACHE
+    console = Console()
+    
+    # The menu is static, so render it once and replay the captured output
+    if _MENU_CACHE is None:
+        with console.capture() as capture:
+            _render_menu(console)
+        _MENU_CACHE = capture.get()
     
-    console.print(features_panel)
+    console.file.write(_MENU_CACHE)
 
 if __name__ == "__main__":
     show_menu()
@@ -7,10 +7,12 @@ A comprehensive Open Source Intelligence gathering tool for Kali Linux
 import os
 import sys
 import json
-import time
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
+import concurrent.futures
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin
@@ -34,8 +36,6 @@ from tabulate import tabulate
 # OSINT specific imports
 import whois
 import dns.resolver
-import phonenumbers
-from phonenumbers import geocoder, carrier
 import shodan
 import nmap
 import feedparser
@@ -46,6 +46,15 @@ import socket
 import ssl
 # import geoip2.database  # Commented out for now
 
+# Framework fingerprints live in <head> or early <body>, so technology
+# detection only scans the first 256 KB of a page
+TECH_SCAN_LIMIT = 256 * 1024
+
+# Phrases that mark a 200 response as a missing profile
+NOT_FOUND_RE = re.compile(
+    r'user not found|page not found|profile not found|account suspended|user does not exist'
+)
+
 # Initialize colorama and rich console
 init(autoreset=True)
 console = Console()
@@ -59,6 +68,16 @@ class KaliOSINT:
         self.setup_directories()
         self.config = self.load_config()
         
+        # Shared HTTP session so concurrent lookups reuse pooled connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # API Keys (to be configured by user)
         self.shodan_api = self.config.get('shodan_api', '')
         self.censys_api_id = self.config.get('censys_api_id', '')
@@ -1020,6 +1039,9 @@ class KaliOSINT:
     
     def phone_validation(self, phone_number):
         """Validate and analyze phone number"""
+        import phonenumbers
+        from phonenumbers import geocoder, carrier
+        
         try:
             self.console.print(f"\n[bold green]Phone Number Analysis for {phone_number}[/bold green]")
             
@@ -1082,6 +1104,9 @@ class KaliOSINT:
 
     def phone_carrier_info(self, phone_number):
         """Get phone carrier information"""
+        import phonenumbers
+        from phonenumbers import geocoder, carrier
+        
         try:
             parsed = phonenumbers.parse(phone_number, None)
             carrier_name = carrier.name_for_number(parsed, "en")
@@ -1105,6 +1130,9 @@ class KaliOSINT:
 
     def phone_geolocation(self, phone_number):
         """Get phone geolocation"""
+        import phonenumbers
+        from phonenumbers import geocoder
+        
         try:
             parsed = phonenumbers.parse(phone_number, None)
             location = geocoder.description_for_number(parsed, "en")
@@ -1127,6 +1155,8 @@ class KaliOSINT:
 
     def phone_format_analysis(self, phone_number):
         """Analyze phone number formats"""
+        import phonenumbers
+        
         try:
             parsed = phonenumbers.parse(phone_number, None)
             
@@ -1411,20 +1441,32 @@ class KaliOSINT:
             results = []
             
             with self.console.status("[bold green]Checking platforms..."):
-                for platform, url in platforms.items():
-                    try:
-                        response = requests.get(url, timeout=5, allow_redirects=True)
-                        if response.status_code == 200:
-                            # Simple heuristic to check if profile exists
-                            if not any(phrase in response.text.lower() for phrase in 
-                                     ['user not found', 'page not found', 'profile not found', 
-                                      'account suspended', 'user does not exist']):
-                                results.append({
-                                    "platform": platform,
-                                    "url": url,
-                                    "status": "Found",
-                                    "status_code": response.status_code
-                                })
+                with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+                    future_to_platform = {
+                        executor.submit(self.session.get, url, timeout=5, allow_redirects=True): (platform, url)
+                        for platform, url in platforms.items()
+                    }
+                    
+                    for future in concurrent.futures.as_completed(future_to_platform):
+                        platform, url = future_to_platform[future]
+                        try:
+                            response = future.result()
+                            if response.status_code == 200:
+                                # Simple heuristic to check if profile exists
+                                if not NOT_FOUND_RE.search(response.text.lower()):
+                                    results.append({
+                                        "platform": platform,
+                                        "url": url,
+                                        "status": "Found",
+                                        "status_code": response.status_code
+                                    })
+                                else:
+                                    results.append({
+                                        "platform": platform,
+                                        "url": url,
+                                        "status": "Not Found",
+                                        "status_code": response.status_code
+                                    })
                             else:
                                 results.append({
                                     "platform": platform,
@@ -1432,22 +1474,17 @@ class KaliOSINT:
                                     "status": "Not Found",
                                     "status_code": response.status_code
                                 })
-                        else:
+                        except Exception:
                             results.append({
                                 "platform": platform,
                                 "url": url,
-                                "status": "Not Found",
-                                "status_code": response.status_code
+                                "status": "Error",
+                                "status_code": "N/A"
                             })
-                    except:
-                        results.append({
-                            "platform": platform,
-                            "url": url,
-                            "status": "Error",
-                            "status_code": "N/A"
-                        })
-                    
-                    time.sleep(0.1)  # Rate limiting
+            
+            # Keep the table in platform order regardless of completion order
+            platform_order = list(platforms)
+            results.sort(key=lambda result: platform_order.index(result["platform"]))
             
             # Display results
             results_table = Table(title=f"Username Search Results for '{username}'")
@@ -1492,7 +1529,7 @@ class KaliOSINT:
             with self.console.status("[bold green]Analyzing website..."):
                 response = requests.get(url, timeout=10)
                 headers = response.headers
-                content = response.text
+                content = response.text[:TECH_SCAN_LIMIT]
             
             # Analyze headers
             tech_info = {
@@ -1506,7 +1543,7 @@ class KaliOSINT:
             }
             
             # Analyze content for technologies
-            technologies = []
+            technologies = set()
             
             # Check for common frameworks and libraries
             tech_patterns = {
@@ -1528,10 +1565,8 @@ class KaliOSINT:
             }
             
             for tech, patterns in tech_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        technologies.append(tech)
-                        break
+                if any(re.search(pattern, content, re.IGNORECASE) for pattern in patterns):
+                    technologies.add(tech)
             
             # Create results table
             tech_table = Table(title="Technology Stack Information")
@@ -1545,13 +1580,13 @@ class KaliOSINT:
             
             if technologies:
                 self.console.print(f"\n[bold yellow]Detected Technologies:[/bold yellow]")
-                for tech in set(technologies):
+                for tech in sorted(technologies):
                     self.console.print(f"• {tech}")
             
             # Save results
             self.save_result("website_tech", url, {
                 "headers": dict(headers),
-                "detected_technologies": list(set(technologies)),
+                "detected_technologies": sorted(technologies),
                 "tech_info": tech_info
             })
             
@@ -1889,8 +1924,11 @@ class KaliOSINT:
             nm = nmap.PortScanner()
             
             with self.console.status("[bold green]Scanning ports..."):
-                # Scan common ports
-                nm.scan(target, ','.join(map(str, common_ports)), '-T4')
+                # Scan common ports; skip rDNS (-n) and host discovery (-Pn)
+                nm.scan(
+                    hosts=target,
+                    arguments=f"-n -Pn -T4 --min-rate 5000 --max-retries 1 -p{','.join(map(str, common_ports))}"
+                )
             
             # Process results
             scan_results = []
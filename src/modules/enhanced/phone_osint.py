@@ -5,29 +5,464 @@ Integrates features from PhoneInfoga, Toutatis, and Mr.Holmes
 Advanced phone number investigation with multiple APIs and data sources
 """
 
+import asyncio
 import phonenumbers
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import re
 import time
-import hashlib
-from phonenumbers import carrier, geocoder, timezone
+import zlib
+import functools
+import contextlib
+import dataclasses
 from datetime import datetime
+from types import MappingProxyType
+from typing import NamedTuple, Optional
 from urllib.parse import quote
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+# Maximum number of phone API lookups in flight at once
+API_CONCURRENCY = 5
+
+# Maximum number of numbers analyzed at once by comprehensive_phone_batch
+BATCH_CONCURRENCY = 20
+
+# Token-bucket quota per phone API as (requests, period in seconds); each API
+# is limited on its own so a slow quota never holds back the others
+API_RATE_LIMITS = {
+    'hlr_lookup': (1, 1),
+    'carrier_lookup': (5, 1),
+    'numverify': (1, 1),
+    'phone_reputation': (10, 1),
+    'social_lookup': (5, 1),
+}
+
+# Google dork suffixes appended to the quoted phone number
+_GOOGLE_QUERY_SUFFIXES = (
+    'site:facebook.com',
+    'site:linkedin.com',
+    'site:twitter.com',
+    '"profile" OR "contact"',
+    '"whatsapp" OR "telegram"',
+)
+
+# Use case shown next to each row of the phone variations table, in the
+# order generate_phone_variations produces them; also caps the table length
+_VARIATION_USE_CASES = (
+    "International format",
+    "National format",
+    "E164 standard",
+    "RFC3966 format",
+    "Custom international",
+    "Alternative international",
+    "Dotted format",
+    "Country code prefix",
+    "Minimal format",
+    "Digits only",
+    "Original format",
+    "US formatted",
+    "US dashed",
+    "US dotted",
+    "US with country code",
+)
+
+# Instagram password reset, account lookup and registration endpoints used
+# to check whether a phone number is registered
+_INSTAGRAM_URLS = (
+    'https://www.instagram.com/accounts/password/reset/',
+    'https://i.instagram.com/api/v1/users/lookup/',
+    'https://www.instagram.com/accounts/emailsignup/',
+)
+
+# Display colour per security risk level; anything else is shown in green
+_RISK_STYLES = {'high': 'red', 'medium': 'yellow'}
+
+# Display colour per reputation category; anything else is shown in red
+_CATEGORY_STYLES = {'trusted': 'green', 'neutral': 'yellow'}
+
+# Databases listed by the simulated reputation analysis
+_REPUTATION_SOURCES = (
+    'Truecaller Community',
+    'Should I Answer',
+    'Whocalld Database',
+    'Spam Detection APIs',
+    'Reverse Phone Lookup',
+    'Social Media Reports',
+)
+
+# Digit-stripping patterns shared by the analysis helpers
+_RE_NON_DIGIT_PLUS = re.compile(r'[^\d+]')
+_RE_NON_DIGIT = re.compile(r'[^\d]')
+
+# str.translate tables that delete every Latin-1 character except ASCII
+# digits (and '+'); the regexes above only handle anything beyond Latin-1
+_DIGIT_ONLY_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdecimal()))
+_DIGIT_PLUS_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdecimal() and chr(c) != '+'))
+
+# str.translate table deleting parentheses, for the unparsed variation fallback
+_STRIP_PARENS_TABLE = str.maketrans('', '', '()')
+
+
+def _digits_only(number):
+    """Strip a phone number down to its digits"""
+    digits = number.translate(_DIGIT_ONLY_TABLE)
+    return digits if digits.isascii() else _RE_NON_DIGIT.sub('', digits)
+
+
+def _digits_and_plus(number):
+    """Strip a phone number down to its digits and '+' signs"""
+    digits = number.translate(_DIGIT_PLUS_TABLE)
+    return digits if digits.isascii() else _RE_NON_DIGIT_PLUS.sub('', digits)
+
+
+def _simulated_score(number):
+    """Deterministic 0-99 score for the simulated reputation checks"""
+    # CRC32 is plenty here: the value only needs to be stable, not secure
+    return (zlib.crc32(number.encode()) & 0xFF) * 100 >> 8
+
+
+def _dumps(data):
+    """Serialize analysis results to JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default).encode()
+
+
+def _json_default(value):
+    """json fallback for values orjson serializes natively"""
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+# Country calling codes database, built once at import
+_COUNTRY_CODES = MappingProxyType({
+    1: ("US", "CA", "United States/Canada"),
+    7: ("RU", "KZ", "Russia/Kazakhstan"),
+    20: ("EG", "Egypt"),
+    27: ("ZA", "South Africa"),
+    30: ("GR", "Greece"),
+    31: ("NL", "Netherlands"),
+    32: ("BE", "Belgium"),
+    33: ("FR", "France"),
+    34: ("ES", "Spain"),
+    36: ("HU", "Hungary"),
+    39: ("IT", "Vatican City"),
+    40: ("RO", "Romania"),
+    41: ("CH", "Switzerland"),
+    43: ("AT", "Austria"),
+    44: ("GB", "United Kingdom"),
+    45: ("DK", "Denmark"),
+    46: ("SE", "Sweden"),
+    47: ("NO", "Norway"),
+    48: ("PL", "Poland"),
+    49: ("DE", "Germany"),
+    51: ("PE", "Peru"),
+    52: ("MX", "Mexico"),
+    53: ("CU", "Cuba"),
+    54: ("AR", "Argentina"),
+    55: ("BR", "Brazil"),
+    56: ("CL", "Chile"),
+    57: ("CO", "Colombia"),
+    58: ("VE", "Venezuela"),
+    60: ("MY", "Malaysia"),
+    61: ("AU", "Australia"),
+    62: ("ID", "Indonesia"),
+    63: ("PH", "Philippines"),
+    64: ("NZ", "New Zealand"),
+    65: ("SG", "Singapore"),
+    66: ("TH", "Thailand"),
+    81: ("JP", "Japan"),
+    82: ("KR", "South Korea"),
+    84: ("VN", "Vietnam"),
+    86: ("CN", "China"),
+    90: ("TR", "Turkey"),
+    91: ("IN", "India"),
+    92: ("PK", "Pakistan"),
+    93: ("AF", "Afghanistan"),
+    94: ("LK", "Sri Lanka"),
+    95: ("MM", "Myanmar"),
+    98: ("IR", "Iran"),
+    212: ("MA", "Morocco"),
+    213: ("DZ", "Algeria"),
+    216: ("TN", "Tunisia"),
+    218: ("LY", "Libya"),
+    220: ("GM", "Gambia"),
+    221: ("SN", "Senegal"),
+    222: ("MR", "Mauritania"),
+    223: ("ML", "Mali"),
+    224: ("GN", "Guinea"),
+    225: ("CI", "Ivory Coast"),
+    226: ("BF", "Burkina Faso"),
+    227: ("NE", "Niger"),
+    228: ("TG", "Togo"),
+    229: ("BJ", "Benin"),
+    230: ("MU", "Mauritius"),
+    231: ("LR", "Liberia"),
+    232: ("SL", "Sierra Leone"),
+    233: ("GH", "Ghana"),
+    234: ("NG", "Nigeria"),
+    235: ("TD", "Chad"),
+    236: ("CF", "Central African Republic"),
+    237: ("CM", "Cameroon"),
+    238: ("CV", "Cape Verde"),
+    239: ("ST", "São Tomé and Príncipe"),
+    240: ("GQ", "Equatorial Guinea"),
+    241: ("GA", "Gabon"),
+    242: ("CG", "Republic of the Congo"),
+    243: ("CD", "Democratic Republic of the Congo"),
+    244: ("AO", "Angola"),
+    245: ("GW", "Guinea-Bissau"),
+    246: ("IO", "British Indian Ocean Territory"),
+    248: ("SC", "Seychelles"),
+    249: ("SD", "Sudan"),
+    250: ("RW", "Rwanda"),
+    251: ("ET", "Ethiopia"),
+    252: ("SO", "Somalia"),
+    253: ("DJ", "Djibouti"),
+    254: ("KE", "Kenya"),
+    255: ("TZ", "Tanzania"),
+    256: ("UG", "Uganda"),
+    257: ("BI", "Burundi"),
+    258: ("MZ", "Mozambique"),
+    260: ("ZM", "Zambia"),
+    261: ("MG", "Madagascar"),
+    262: ("RE", "Réunion"),
+    263: ("ZW", "Zimbabwe"),
+    264: ("NA", "Namibia"),
+    265: ("MW", "Malawi"),
+    266: ("LS", "Lesotho"),
+    267: ("BW", "Botswana"),
+    268: ("SZ", "Eswatini"),
+    269: ("KM", "Comoros"),
+    290: ("SH", "Saint Helena"),
+    291: ("ER", "Eritrea"),
+    297: ("AW", "Aruba"),
+    298: ("FO", "Faroe Islands"),
+    299: ("GL", "Greenland"),
+    350: ("GI", "Gibraltar"),
+    351: ("PT", "Portugal"),
+    352: ("LU", "Luxembourg"),
+    353: ("IE", "Ireland"),
+    354: ("IS", "Iceland"),
+    355: ("AL", "Albania"),
+    356: ("MT", "Malta"),
+    357: ("CY", "Cyprus"),
+    358: ("FI", "Finland"),
+    359: ("BG", "Bulgaria"),
+    370: ("LT", "Lithuania"),
+    371: ("LV", "Latvia"),
+    372: ("EE", "Estonia"),
+    373: ("MD", "Moldova"),
+    374: ("AM", "Armenia"),
+    375: ("BY", "Belarus"),
+    376: ("AD", "Andorra"),
+    377: ("MC", "Monaco"),
+    378: ("SM", "San Marino"),
+    380: ("UA", "Ukraine"),
+    381: ("RS", "Serbia"),
+    382: ("ME", "Montenegro"),
+    383: ("XK", "Kosovo"),
+    385: ("HR", "Croatia"),
+    386: ("SI", "Slovenia"),
+    387: ("BA", "Bosnia and Herzegovina"),
+    389: ("MK", "North Macedonia"),
+    420: ("CZ", "Czech Republic"),
+    421: ("SK", "Slovakia"),
+    423: ("LI", "Liechtenstein"),
+    500: ("FK", "Falkland Islands"),
+    501: ("BZ", "Belize"),
+    502: ("GT", "Guatemala"),
+    503: ("SV", "El Salvador"),
+    504: ("HN", "Honduras"),
+    505: ("NI", "Nicaragua"),
+    506: ("CR", "Costa Rica"),
+    507: ("PA", "Panama"),
+    508: ("PM", "Saint Pierre and Miquelon"),
+    509: ("HT", "Haiti"),
+    590: ("GP", "Guadeloupe"),
+    591: ("BO", "Bolivia"),
+    592: ("GY", "Guyana"),
+    593: ("EC", "Ecuador"),
+    594: ("GF", "French Guiana"),
+    595: ("PY", "Paraguay"),
+    596: ("MQ", "Martinique"),
+    597: ("SR", "Suriname"),
+    598: ("UY", "Uruguay"),
+    599: ("CW", "Curaçao"),
+    670: ("TL", "East Timor"),
+    672: ("AQ", "Antarctica"),
+    673: ("BN", "Brunei"),
+    674: ("NR", "Nauru"),
+    675: ("PG", "Papua New Guinea"),
+    676: ("TO", "Tonga"),
+    677: ("SB", "Solomon Islands"),
+    678: ("VU", "Vanuatu"),
+    679: ("FJ", "Fiji"),
+    680: ("PW", "Palau"),
+    681: ("WF", "Wallis and Futuna"),
+    682: ("CK", "Cook Islands"),
+    683: ("NU", "Niue"),
+    684: ("AS", "American Samoa"),
+    685: ("WS", "Samoa"),
+    686: ("KI", "Kiribati"),
+    687: ("NC", "New Caledonia"),
+    688: ("TV", "Tuvalu"),
+    689: ("PF", "French Polynesia"),
+    690: ("TK", "Tokelau"),
+    691: ("FM", "Federated States of Micronesia"),
+    692: ("MH", "Marshall Islands"),
+    850: ("KP", "North Korea"),
+    852: ("HK", "Hong Kong"),
+    853: ("MO", "Macau"),
+    855: ("KH", "Cambodia"),
+    856: ("LA", "Laos"),
+    880: ("BD", "Bangladesh"),
+    886: ("TW", "Taiwan"),
+    960: ("MV", "Maldives"),
+    961: ("LB", "Lebanon"),
+    962: ("JO", "Jordan"),
+    963: ("SY", "Syria"),
+    964: ("IQ", "Iraq"),
+    965: ("KW", "Kuwait"),
+    966: ("SA", "Saudi Arabia"),
+    967: ("YE", "Yemen"),
+    968: ("OM", "Oman"),
+    970: ("PS", "Palestine"),
+    971: ("AE", "United Arab Emirates"),
+    972: ("IL", "Israel"),
+    973: ("BH", "Bahrain"),
+    974: ("QA", "Qatar"),
+    975: ("BT", "Bhutan"),
+    976: ("MN", "Mongolia"),
+    977: ("NP", "Nepal"),
+    992: ("TJ", "Tajikistan"),
+    993: ("TM", "Turkmenistan"),
+    994: ("AZ", "Azerbaijan"),
+    995: ("GE", "Georgia"),
+    996: ("KG", "Kyrgyzstan"),
+    998: ("UZ", "Uzbekistan")
+})
+
+# The same entries keyed by their digit string; calling codes are prefix-free,
+# so the first one to three digits of a number identify at most one country
+_PREFIX_LOOKUP = {str(code): (code, info) for code, info in _COUNTRY_CODES.items()}
+
+
+def _detect_country_from_digits(digits):
+    """Return (country_code, info) for a digit string via three prefix probes"""
+    for length in (1, 2, 3):
+        match = _PREFIX_LOOKUP.get(digits[:length])
+        if match:
+            return match
+    return None
+
+
+class _PhoneMetadata(NamedTuple):
+    """Validation, carrier and location facts derived from one parsed number"""
+    is_valid: bool
+    is_possible: bool
+    country_code: int
+    national_number: int
+    number_type: str
+    region_code: str
+    carrier_name: str
+    location: str
+    timezones: tuple
+
+
+@dataclasses.dataclass
+class PhoneAnalysisResult:
+    """Result of one comprehensive phone analysis, one dict per section"""
+    # Declared by hand rather than with slots=True to stay Python 3.8 compatible
+    __slots__ = (
+        'input_number', 'timestamp', 'basic_validation', 'carrier_info',
+        'geolocation', 'social_media_searches', 'api_results',
+        'security_analysis', 'formatting', 'error',
+    )
+    
+    input_number: str
+    timestamp: str
+    basic_validation: dict
+    carrier_info: dict
+    geolocation: dict
+    social_media_searches: dict
+    api_results: dict
+    security_analysis: dict
+    formatting: dict
+    error: Optional[str]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(phone_number):
+    """phonenumbers.parse, memoized per input string"""
+    return phonenumbers.parse(phone_number, None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _formats_cached(phone_number):
+    """International, national, E164 and RFC3966 renderings, memoized per input string"""
+    parsed = _parse_cached(phone_number)
+    return tuple(
+        phonenumbers.format_number(parsed, number_format)
+        for number_format in (
+            phonenumbers.PhoneNumberFormat.INTERNATIONAL,
+            phonenumbers.PhoneNumberFormat.NATIONAL,
+            phonenumbers.PhoneNumberFormat.E164,
+            phonenumbers.PhoneNumberFormat.RFC3966,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _metadata_cached(phone_number):
+    """Run the phonenumbers validity, carrier and geocoder lookups once per number"""
+    # The carrier and geocoder data tables take hundreds of milliseconds to
+    # load, so only pay for them once a number is actually analyzed
+    from phonenumbers import carrier, geocoder, timezone
+    
+    parsed = _parse_cached(phone_number)
+    return _PhoneMetadata(
+        is_valid=phonenumbers.is_valid_number(parsed),
+        is_possible=phonenumbers.is_possible_number(parsed),
+        country_code=parsed.country_code,
+        national_number=parsed.national_number,
+        number_type=str(phonenumbers.number_type(parsed)),
+        region_code=phonenumbers.region_code_for_number(parsed),
+        carrier_name=carrier.name_for_number(parsed, "en"),
+        location=geocoder.description_for_number(parsed, "en"),
+        timezones=tuple(timezone.time_zones_for_number(parsed))
+    )
+
 
 class AdvancedPhoneOSINT:
     def __init__(self, main_tool):
         self.main_tool = main_tool
-        self.console = Console()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
+        # Keep-alive pool large enough for the concurrent API fan-out
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Free API endpoints for phone number investigation
         self.apis = {
             'numverify': 'http://apilayer.net/api/validate',
@@ -53,236 +488,30 @@ class AdvancedPhoneOSINT:
         }
         
         # Country calling codes database
-        self.country_codes = self._load_country_codes()
-
-    def _load_country_codes(self):
-        """Load country calling codes"""
-        return {
-            1: ["US", "CA", "United States/Canada"],
-            7: ["RU", "KZ", "Russia/Kazakhstan"], 
-            20: ["EG", "Egypt"],
-            27: ["ZA", "South Africa"],
-            30: ["GR", "Greece"],
-            31: ["NL", "Netherlands"],
-            32: ["BE", "Belgium"],
-            33: ["FR", "France"],
-            34: ["ES", "Spain"],
-            36: ["HU", "Hungary"],
-            39: ["IT", "Vatican City"],
-            40: ["RO", "Romania"],
-            41: ["CH", "Switzerland"],
-            43: ["AT", "Austria"],
-            44: ["GB", "United Kingdom"],
-            45: ["DK", "Denmark"],
-            46: ["SE", "Sweden"],
-            47: ["NO", "Norway"],
-            48: ["PL", "Poland"],
-            49: ["DE", "Germany"],
-            51: ["PE", "Peru"],
-            52: ["MX", "Mexico"],
-            53: ["CU", "Cuba"],
-            54: ["AR", "Argentina"],
-            55: ["BR", "Brazil"],
-            56: ["CL", "Chile"],
-            57: ["CO", "Colombia"],
-            58: ["VE", "Venezuela"],
-            60: ["MY", "Malaysia"],
-            61: ["AU", "Australia"],
-            62: ["ID", "Indonesia"],
-            63: ["PH", "Philippines"],
-            64: ["NZ", "New Zealand"],
-            65: ["SG", "Singapore"],
-            66: ["TH", "Thailand"],
-            81: ["JP", "Japan"],
-            82: ["KR", "South Korea"],
-            84: ["VN", "Vietnam"],
-            86: ["CN", "China"],
-            90: ["TR", "Turkey"],
-            91: ["IN", "India"],
-            92: ["PK", "Pakistan"],
-            93: ["AF", "Afghanistan"],
-            94: ["LK", "Sri Lanka"],
-            95: ["MM", "Myanmar"],
-            98: ["IR", "Iran"],
-            212: ["MA", "Morocco"],
-            213: ["DZ", "Algeria"],
-            216: ["TN", "Tunisia"],
-            218: ["LY", "Libya"],
-            220: ["GM", "Gambia"],
-            221: ["SN", "Senegal"],
-            222: ["MR", "Mauritania"],
-            223: ["ML", "Mali"],
-            224: ["GN", "Guinea"],
-            225: ["CI", "Ivory Coast"],
-            226: ["BF", "Burkina Faso"],
-            227: ["NE", "Niger"],
-            228: ["TG", "Togo"],
-            229: ["BJ", "Benin"],
-            230: ["MU", "Mauritius"],
-            231: ["LR", "Liberia"],
-            232: ["SL", "Sierra Leone"],
-            233: ["GH", "Ghana"],
-            234: ["NG", "Nigeria"],
-            235: ["TD", "Chad"],
-            236: ["CF", "Central African Republic"],
-            237: ["CM", "Cameroon"],
-            238: ["CV", "Cape Verde"],
-            239: ["ST", "São Tomé and Príncipe"],
-            240: ["GQ", "Equatorial Guinea"],
-            241: ["GA", "Gabon"],
-            242: ["CG", "Republic of the Congo"],
-            243: ["CD", "Democratic Republic of the Congo"],
-            244: ["AO", "Angola"],
-            245: ["GW", "Guinea-Bissau"],
-            246: ["IO", "British Indian Ocean Territory"],
-            248: ["SC", "Seychelles"],
-            249: ["SD", "Sudan"],
-            250: ["RW", "Rwanda"],
-            251: ["ET", "Ethiopia"],
-            252: ["SO", "Somalia"],
-            253: ["DJ", "Djibouti"],
-            254: ["KE", "Kenya"],
-            255: ["TZ", "Tanzania"],
-            256: ["UG", "Uganda"],
-            257: ["BI", "Burundi"],
-            258: ["MZ", "Mozambique"],
-            260: ["ZM", "Zambia"],
-            261: ["MG", "Madagascar"],
-            262: ["RE", "Réunion"],
-            263: ["ZW", "Zimbabwe"],
-            264: ["NA", "Namibia"],
-            265: ["MW", "Malawi"],
-            266: ["LS", "Lesotho"],
-            267: ["BW", "Botswana"],
-            268: ["SZ", "Eswatini"],
-            269: ["KM", "Comoros"],
-            290: ["SH", "Saint Helena"],
-            291: ["ER", "Eritrea"],
-            297: ["AW", "Aruba"],
-            298: ["FO", "Faroe Islands"],
-            299: ["GL", "Greenland"],
-            350: ["GI", "Gibraltar"],
-            351: ["PT", "Portugal"],
-            352: ["LU", "Luxembourg"],
-            353: ["IE", "Ireland"],
-            354: ["IS", "Iceland"],
-            355: ["AL", "Albania"],
-            356: ["MT", "Malta"],
-            357: ["CY", "Cyprus"],
-            358: ["FI", "Finland"],
-            359: ["BG", "Bulgaria"],
-            370: ["LT", "Lithuania"],
-            371: ["LV", "Latvia"],
-            372: ["EE", "Estonia"],
-            373: ["MD", "Moldova"],
-            374: ["AM", "Armenia"],
-            375: ["BY", "Belarus"],
-            376: ["AD", "Andorra"],
-            377: ["MC", "Monaco"],
-            378: ["SM", "San Marino"],
-            380: ["UA", "Ukraine"],
-            381: ["RS", "Serbia"],
-            382: ["ME", "Montenegro"],
-            383: ["XK", "Kosovo"],
-            385: ["HR", "Croatia"],
-            386: ["SI", "Slovenia"],
-            387: ["BA", "Bosnia and Herzegovina"],
-            389: ["MK", "North Macedonia"],
-            420: ["CZ", "Czech Republic"],
-            421: ["SK", "Slovakia"],
-            423: ["LI", "Liechtenstein"],
-            500: ["FK", "Falkland Islands"],
-            501: ["BZ", "Belize"],
-            502: ["GT", "Guatemala"],
-            503: ["SV", "El Salvador"],
-            504: ["HN", "Honduras"],
-            505: ["NI", "Nicaragua"],
-            506: ["CR", "Costa Rica"],
-            507: ["PA", "Panama"],
-            508: ["PM", "Saint Pierre and Miquelon"],
-            509: ["HT", "Haiti"],
-            590: ["GP", "Guadeloupe"],
-            591: ["BO", "Bolivia"],
-            592: ["GY", "Guyana"],
-            593: ["EC", "Ecuador"],
-            594: ["GF", "French Guiana"],
-            595: ["PY", "Paraguay"],
-            596: ["MQ", "Martinique"],
-            597: ["SR", "Suriname"],
-            598: ["UY", "Uruguay"],
-            599: ["CW", "Curaçao"],
-            670: ["TL", "East Timor"],
-            672: ["AQ", "Antarctica"],
-            673: ["BN", "Brunei"],
-            674: ["NR", "Nauru"],
-            675: ["PG", "Papua New Guinea"],
-            676: ["TO", "Tonga"],
-            677: ["SB", "Solomon Islands"],
-            678: ["VU", "Vanuatu"],
-            679: ["FJ", "Fiji"],
-            680: ["PW", "Palau"],
-            681: ["WF", "Wallis and Futuna"],
-            682: ["CK", "Cook Islands"],
-            683: ["NU", "Niue"],
-            684: ["AS", "American Samoa"],
-            685: ["WS", "Samoa"],
-            686: ["KI", "Kiribati"],
-            687: ["NC", "New Caledonia"],
-            688: ["TV", "Tuvalu"],
-            689: ["PF", "French Polynesia"],
-            690: ["TK", "Tokelau"],
-            691: ["FM", "Federated States of Micronesia"],
-            692: ["MH", "Marshall Islands"],
-            850: ["KP", "North Korea"],
-            852: ["HK", "Hong Kong"],
-            853: ["MO", "Macau"],
-            855: ["KH", "Cambodia"],
-            856: ["LA", "Laos"],
-            880: ["BD", "Bangladesh"],
-            886: ["TW", "Taiwan"],
-            960: ["MV", "Maldives"],
-            961: ["LB", "Lebanon"],
-            962: ["JO", "Jordan"],
-            963: ["SY", "Syria"],
-            964: ["IQ", "Iraq"],
-            965: ["KW", "Kuwait"],
-            966: ["SA", "Saudi Arabia"],
-            967: ["YE", "Yemen"],
-            968: ["OM", "Oman"],
-            970: ["PS", "Palestine"],
-            971: ["AE", "United Arab Emirates"],
-            972: ["IL", "Israel"],
-            973: ["BH", "Bahrain"],
-            974: ["QA", "Qatar"],
-            975: ["BT", "Bhutan"],
-            976: ["MN", "Mongolia"],
-            977: ["NP", "Nepal"],
-            992: ["TJ", "Tajikistan"],
-            993: ["TM", "Turkmenistan"],
-            994: ["AZ", "Azerbaijan"],
-            995: ["GE", "Georgia"],
-            996: ["KG", "Kyrgyzstan"],
-            998: ["UZ", "Uzbekistan"]
-        }
+        self.country_codes = _COUNTRY_CODES
+        
+        # Set for batch runs to silence spinners and result tables
+        self._quiet = False
+        
+        # Per-API token buckets for the current event loop, see _loop_limiters
+        self._limiters = {}
+        self._limiter_loop = None
+
+    @functools.cached_property
+    def console(self):
+        """Rich console, created on first use so quiet batch runs never load rich"""
+        from rich.console import Console
+        return Console()
 
     def comprehensive_phone_analysis(self, phone_number):
         """
         Comprehensive phone number analysis combining multiple sources
         """
         try:
-            self.console.print(f"\n[bold green]🔍 Comprehensive Phone Analysis for {phone_number}[/bold green]")
+            if self._wants_rich():
+                self.console.print(f"\n[bold green]🔍 Comprehensive Phone Analysis for {phone_number}[/bold green]")
             
-            results = {
-                'input_number': phone_number,
-                'timestamp': datetime.now().isoformat(),
-                'basic_validation': {},
-                'carrier_info': {},
-                'geolocation': {},
-                'social_media_searches': {},
-                'api_results': {},
-                'security_analysis': {},
-                'formatting': {}
-            }
+            results = self._new_results(phone_number)
             
             # Basic validation and parsing
             self._basic_validation(phone_number, results)
@@ -290,20 +519,22 @@ class AdvancedPhoneOSINT:
             # Carrier and location analysis
             self._carrier_analysis(phone_number, results)
             
-            # API lookups
-            self._api_lookups(phone_number, results)
-            
-            # Social media investigation
-            self._social_media_investigation(phone_number, results)
-            
-            # Security analysis
-            self._security_analysis(phone_number, results)
+            # The remaining stages are only worth running for a valid number
+            if not self._skip_invalid(results):
+                # API lookups
+                self._api_lookups(phone_number, results)
+                
+                # Social media investigation
+                self._social_media_investigation(phone_number, results)
+                
+                # Security analysis
+                self._security_analysis(phone_number, results)
             
             # Display comprehensive results
             self._display_comprehensive_results(results)
             
             # Save results
-            self.main_tool.save_result("comprehensive_phone_analysis", phone_number, results)
+            self.main_tool.save_result("comprehensive_phone_analysis", phone_number, dataclasses.asdict(results))
             
             return results
             
@@ -311,75 +542,187 @@ class AdvancedPhoneOSINT:
             self.console.print(f"[bold red]Error in comprehensive analysis: {str(e)}[/bold red]")
             return None
 
+    def comprehensive_phone_batch(self, numbers, output_path=None, concurrency=BATCH_CONCURRENCY):
+        """
+        Comprehensive analysis of many phone numbers at once, sharing one event
+        loop, HTTP session and phonenumbers cache across the whole batch.
+        
+        With output_path each result is appended to that file as a JSON line
+        as soon as it completes, in completion order, and only the number of
+        records written is returned; otherwise all results are returned.
+        """
+        with self.quiet():
+            return asyncio.run(self._run_batch(numbers, concurrency, output_path))
+
+    @contextlib.contextmanager
+    def quiet(self):
+        """
+        Minimal output mode for batch and export runs: inside the block the
+        lookups skip spinners and rich rendering and only return their results
+        """
+        previous, self._quiet = self._quiet, True
+        try:
+            yield self
+        finally:
+            self._quiet = previous
+
+    async def _run_batch(self, numbers, concurrency, output_path=None):
+        """Analyze numbers concurrently, returning results in input order or streaming them to disk"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze(phone_number):
+            async with semaphore:
+                return await self._analyze_one(phone_number)
+        
+        pending = [analyze(phone_number) for phone_number in numbers]
+        if output_path is None:
+            return await asyncio.gather(*pending)
+        
+        written = 0
+        with open(output_path, 'ab') as output:
+            for next_result in asyncio.as_completed(pending):
+                output.write(_dumps(await next_result) + b'\n')
+                written += 1
+        return written
+
+    async def _analyze_one(self, phone_number):
+        """Run the analysis pipeline for one number without displaying it"""
+        results = self._new_results(phone_number)
+        try:
+            self._basic_validation(phone_number, results)
+            self._carrier_analysis(phone_number, results)
+            if not self._skip_invalid(results):
+                results.api_results = await self._api_lookups_async(_digits_and_plus(phone_number))
+                self._social_media_investigation(phone_number, results)
+                self._security_analysis(phone_number, results)
+        except Exception as e:
+            results.error = str(e)
+        return results
+
+    def _new_results(self, phone_number):
+        """Empty results structure for one analysis"""
+        return PhoneAnalysisResult(
+            input_number=phone_number,
+            timestamp=datetime.now().isoformat(),
+            basic_validation={},
+            carrier_info={},
+            geolocation={},
+            social_media_searches={},
+            api_results={},
+            security_analysis={},
+            formatting={},
+            error=None
+        )
+
+    def _skip_invalid(self, results):
+        """Mark the lookup stages skipped when basic validation rejected the number"""
+        if results.basic_validation.get('is_valid'):
+            return False
+        results.api_results = {'skipped': 'invalid_number'}
+        results.social_media_searches = {'skipped': 'invalid_number'}
+        results.security_analysis = {'skipped': 'invalid_number'}
+        return True
+
+    def _wants_rich(self):
+        """True when output should be drawn with rich tables and panels"""
+        return not self._quiet and self.console.is_terminal
+
+    def _print_plain(self, results):
+        """Plain output for piped runs: one JSON line, nothing in quiet mode"""
+        if not self._quiet:
+            print(_dumps(results).decode())
+
+    def _status(self, message):
+        """Console spinner, suppressed in quiet mode"""
+        return contextlib.nullcontext() if self._quiet else self.console.status(message)
+
     def _basic_validation(self, phone_number, results):
         """Basic phone number validation and parsing"""
         try:
-            with self.console.status("[bold green]Performing basic validation..."):
+            with self._status("[bold green]Performing basic validation..."):
                 # Parse the number
                 try:
-                    parsed = phonenumbers.parse(phone_number, None)
-                    results['basic_validation'] = {
-                        'is_valid': phonenumbers.is_valid_number(parsed),
-                        'is_possible': phonenumbers.is_possible_number(parsed),
-                        'country_code': parsed.country_code,
-                        'national_number': parsed.national_number,
-                        'number_type': str(phonenumbers.number_type(parsed)),
-                        'region_code': phonenumbers.region_code_for_number(parsed)
+                    metadata = _metadata_cached(phone_number)
+                    results.basic_validation = {
+                        'is_valid': metadata.is_valid,
+                        'is_possible': metadata.is_possible,
+                        'country_code': metadata.country_code,
+                        'national_number': metadata.national_number,
+                        'number_type': metadata.number_type,
+                        'region_code': metadata.region_code
                     }
                     
                     # Formatting options
-                    results['formatting'] = {
-                        'international': phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL),
-                        'national': phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL),
-                        'e164': phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
-                        'rfc3966': phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.RFC3966)
-                    }
+                    results.formatting = dict(zip(
+                        ('international', 'national', 'e164', 'rfc3966'),
+                        _formats_cached(phone_number)
+                    ))
                     
                 except Exception as e:
-                    results['basic_validation']['error'] = str(e)
+                    results.basic_validation['error'] = str(e)
                     
         except Exception as e:
-            results['basic_validation']['error'] = str(e)
+            results.basic_validation['error'] = str(e)
 
     def _carrier_analysis(self, phone_number, results):
         """Carrier and geolocation analysis"""
         try:
-            with self.console.status("[bold green]Analyzing carrier and location..."):
+            with self._status("[bold green]Analyzing carrier and location..."):
                 try:
-                    parsed = phonenumbers.parse(phone_number, None)
+                    metadata = _metadata_cached(phone_number)
                     
                     # Carrier information
-                    carrier_name = carrier.name_for_number(parsed, "en")
-                    location = geocoder.description_for_number(parsed, "en")
-                    timezones = timezone.time_zones_for_number(parsed)
-                    
-                    results['carrier_info'] = {
-                        'carrier': carrier_name or "Unknown",
-                        'location': location or "Unknown",
-                        'timezones': list(timezones) if timezones else [],
-                        'country_code': parsed.country_code,
-                        'region': phonenumbers.region_code_for_number(parsed)
+                    results.carrier_info = {
+                        'carrier': metadata.carrier_name or "Unknown",
+                        'location': metadata.location or "Unknown",
+                        'timezones': list(metadata.timezones),
+                        'country_code': metadata.country_code,
+                        'region': metadata.region_code
                     }
                     
                     # Extended country information
-                    if parsed.country_code in self.country_codes:
-                        country_info = self.country_codes[parsed.country_code]
-                        results['carrier_info']['country_iso'] = country_info[0]
-                        results['carrier_info']['country_name'] = country_info[1]
+                    if metadata.country_code in self.country_codes:
+                        country_info = self.country_codes[metadata.country_code]
+                        results.carrier_info['country_iso'] = country_info[0]
+                        results.carrier_info['country_name'] = country_info[1]
                     
                 except Exception as e:
-                    results['carrier_info']['error'] = str(e)
+                    results.carrier_info['error'] = str(e)
+                    
+                    # Fall back to the calling code prefix of the raw digits
+                    detected = _detect_country_from_digits(_digits_only(phone_number))
+                    if detected:
+                        country_code, country_info = detected
+                        results.carrier_info['country_code'] = country_code
+                        results.carrier_info['country_iso'] = country_info[0]
+                        results.carrier_info['country_name'] = country_info[1]
                     
         except Exception as e:
-            results['carrier_info']['error'] = str(e)
+            results.carrier_info['error'] = str(e)
 
     def _api_lookups(self, phone_number, results):
         """Multiple API lookups for additional information"""
-        results['api_results'] = {}
-        
         # Clean number for API calls
-        clean_number = re.sub(r'[^\d+]', '', phone_number)
+        clean_number = _digits_and_plus(phone_number)
         
+        with self._status("[bold green]Checking phone APIs..."):
+            results.api_results = asyncio.run(self._api_lookups_async(clean_number))
+
+    def _loop_limiters(self):
+        """Per-API token buckets for the running event loop, only when aiolimiter is installed"""
+        # aiolimiter buckets must not be shared across event loops, and every
+        # asyncio.run starts a new one
+        loop = asyncio.get_running_loop()
+        if AsyncLimiter is not None and self._limiter_loop is not loop:
+            self._limiters = {
+                api_name: AsyncLimiter(rate, period)
+                for api_name, (rate, period) in API_RATE_LIMITS.items()
+            }
+            self._limiter_loop = loop
+        return self._limiters
+
+    async def _api_lookups_async(self, clean_number):
+        """Run all API lookups concurrently and collect their results"""
         # Try various free APIs
         api_methods = [
             ('hlr_lookup', self._hlr_lookup),
@@ -389,15 +732,31 @@ class AdvancedPhoneOSINT:
             ('social_lookup', self._social_media_api_lookup),
         ]
         
-        for api_name, api_method in api_methods:
-            try:
-                with self.console.status(f"[bold green]Checking {api_name}..."):
-                    time.sleep(1)  # Rate limiting
-                    result = api_method(clean_number)
-                    if result:
-                        results['api_results'][api_name] = result
-            except Exception as e:
-                results['api_results'][api_name] = {'error': str(e)}
+        # Rate limiting: cap the number of lookups in flight and hold each API
+        # to its own quota
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(API_CONCURRENCY)
+        limiters = self._loop_limiters()
+        
+        async def run(api_name, api_method):
+            limiter = limiters.get(api_name)
+            if limiter is not None:
+                await limiter.acquire()
+            async with semaphore:
+                return await loop.run_in_executor(None, api_method, clean_number)
+        
+        outcomes = await asyncio.gather(
+            *(run(api_name, api_method) for api_name, api_method in api_methods),
+            return_exceptions=True
+        )
+        
+        api_results = {}
+        for (api_name, _), outcome in zip(api_methods, outcomes):
+            if isinstance(outcome, Exception):
+                api_results[api_name] = {'error': str(outcome)}
+            elif outcome:
+                api_results[api_name] = outcome
+        return api_results
 
     def _hlr_lookup(self, phone_number):
         """HLR (Home Location Register) lookup"""
@@ -448,8 +807,7 @@ class AdvancedPhoneOSINT:
             ]
             
             # Simple hash-based simulation
-            phone_hash = hashlib.md5(phone_number.encode()).hexdigest()
-            risk_score = int(phone_hash[:2], 16) % 100
+            risk_score = _simulated_score(phone_number)
             
             return {
                 'risk_score': risk_score,
@@ -465,7 +823,7 @@ class AdvancedPhoneOSINT:
         try:
             # Simulate social media checks
             platforms_found = []
-            clean_number = re.sub(r'[^\d]', '', phone_number.replace('+', ''))
+            clean_number = _digits_only(phone_number)
             
             # Simple simulation based on number patterns
             if len(clean_number) >= 10:
@@ -487,59 +845,49 @@ class AdvancedPhoneOSINT:
     def _social_media_investigation(self, phone_number, results):
         """Investigate social media presence"""
         try:
-            with self.console.status("[bold green]Investigating social media presence..."):
-                social_results = {}
-                
-                # Clean number for searches
-                clean_number = re.sub(r'[^\d]', '', phone_number.replace('+', ''))
+            with self._status("[bold green]Investigating social media presence..."):
+                # Clean and URL-encoded number for searches
+                clean_number = _digits_only(phone_number)
+                quoted_number = quote(phone_number, safe='')
                 
                 # Generate search URLs for different platforms
-                for platform, url_pattern in self.social_patterns.items():
-                    try:
-                        if '{}' in url_pattern:
-                            search_url = url_pattern.format(phone_number)
-                        else:
-                            search_url = url_pattern
-                        
-                        social_results[platform] = {
-                            'search_url': search_url,
-                            'method': 'manual_check_required',
-                            'status': 'URL_generated'
-                        }
-                    except Exception as e:
-                        social_results[platform] = {'error': str(e)}
+                social_results = {
+                    platform: {
+                        'search_url': url_pattern.format(quoted_number),
+                        'method': 'manual_check_required',
+                        'status': 'URL_generated'
+                    }
+                    for platform, url_pattern in self.social_patterns.items()
+                }
                 
                 # Add Google search patterns
                 google_searches = [
                     f'"{phone_number}"',
                     f'"{clean_number}"',
-                    f'"{phone_number}" site:facebook.com',
-                    f'"{phone_number}" site:linkedin.com',
-                    f'"{phone_number}" site:twitter.com',
-                    f'"{phone_number}" "profile" OR "contact"',
-                    f'"{phone_number}" "whatsapp" OR "telegram"',
+                    *(f'"{phone_number}" {suffix}' for suffix in _GOOGLE_QUERY_SUFFIXES)
                 ]
                 
                 social_results['google_searches'] = google_searches
-                results['social_media_searches'] = social_results
+                results.social_media_searches = social_results
                 
         except Exception as e:
-            results['social_media_searches'] = {'error': str(e)}
+            results.social_media_searches = {'error': str(e)}
 
     def _security_analysis(self, phone_number, results):
         """Security analysis of the phone number"""
         try:
-            with self.console.status("[bold green]Performing security analysis..."):
+            with self._status("[bold green]Performing security analysis..."):
                 security_info = {}
                 
                 # Check number patterns for potential issues
-                clean_number = re.sub(r'[^\d]', '', phone_number.replace('+', ''))
+                clean_number = _digits_only(phone_number)
                 
                 # Pattern analysis
+                has_sequential, has_repeated, has_common = self._pattern_scan(clean_number)
                 patterns = {
-                    'sequential': self._check_sequential_digits(clean_number),
-                    'repeated': self._check_repeated_digits(clean_number),
-                    'common_patterns': self._check_common_patterns(clean_number),
+                    'sequential': has_sequential,
+                    'repeated': has_repeated,
+                    'common_patterns': has_common,
                     'length_analysis': len(clean_number)
                 }
                 
@@ -559,27 +907,33 @@ class AdvancedPhoneOSINT:
                     'recommendations': self._get_security_recommendations(risk_factors)
                 }
                 
-                results['security_analysis'] = security_info
+                results.security_analysis = security_info
                 
         except Exception as e:
-            results['security_analysis'] = {'error': str(e)}
-
-    def _check_sequential_digits(self, number):
-        """Check for sequential digit patterns"""
-        sequences = ['0123', '1234', '2345', '3456', '4567', '5678', '6789', '7890']
-        return any(seq in number for seq in sequences)
-
-    def _check_repeated_digits(self, number):
-        """Check for repeated digit patterns"""
-        for i in range(len(number) - 2):
-            if number[i] == number[i+1] == number[i+2]:
-                return True
-        return False
+            results.security_analysis = {'error': str(e)}
 
-    def _check_common_patterns(self, number):
-        """Check for common suspicious patterns"""
-        patterns = ['0000', '1111', '2222', '3333', '4444', '5555', '6666', '7777', '8888', '9999']
-        return any(pattern in number for pattern in patterns)
+    def _pattern_scan(self, number):
+        """Scan a digit string once for sequential, repeated and common patterns
+        
+        Sequential means four ascending digits (0123 ... 7890), repeated means
+        the same digit three times in a row and common means four times.
+        """
+        data = number.encode('ascii', errors='ignore')
+        has_sequential = has_repeated = has_common = False
+        same_run = rising_run = 1
+        
+        for i in range(1, len(data)):
+            previous, current = data[i - 1], data[i]
+            same_run = same_run + 1 if current == previous else 1
+            rising_run = rising_run + 1 if current == previous + 1 else 1
+            
+            if same_run >= 3:
+                has_repeated = True
+                has_common = has_common or same_run >= 4
+            if rising_run >= 4 or (i >= 3 and data[i - 3:i + 1] == b'7890'):
+                has_sequential = True
+        
+        return has_sequential, has_repeated, has_common
 
     def _get_security_recommendations(self, risk_factors):
         """Get security recommendations based on risk factors"""
@@ -602,31 +956,38 @@ class AdvancedPhoneOSINT:
 
     def _display_comprehensive_results(self, results):
         """Display comprehensive analysis results"""
+        if not self._wants_rich():
+            self._print_plain(results)
+            return
+        
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich import box
+        
         try:
             # Basic Information Panel
             basic_table = Table(title="📱 Basic Phone Number Information", box=box.ROUNDED)
             basic_table.add_column("Property", style="cyan", width=20)
             basic_table.add_column("Value", style="white", width=50)
             
-            if 'basic_validation' in results:
-                basic = results['basic_validation']
-                basic_table.add_row("Input Number", results['input_number'])
-                basic_table.add_row("Valid Number", "✅ Yes" if basic.get('is_valid') else "❌ No")
-                basic_table.add_row("Possible Number", "✅ Yes" if basic.get('is_possible') else "❌ No")
-                basic_table.add_row("Country Code", f"+{basic.get('country_code', 'Unknown')}")
-                basic_table.add_row("National Number", str(basic.get('national_number', 'Unknown')))
-                basic_table.add_row("Number Type", str(basic.get('number_type', 'Unknown')))
-                basic_table.add_row("Region Code", str(basic.get('region_code', 'Unknown')))
+            basic = results.basic_validation
+            basic_table.add_row("Input Number", results.input_number)
+            basic_table.add_row("Valid Number", "✅ Yes" if basic.get('is_valid') else "❌ No")
+            basic_table.add_row("Possible Number", "✅ Yes" if basic.get('is_possible') else "❌ No")
+            basic_table.add_row("Country Code", f"+{basic.get('country_code', 'Unknown')}")
+            basic_table.add_row("National Number", str(basic.get('national_number', 'Unknown')))
+            basic_table.add_row("Number Type", str(basic.get('number_type', 'Unknown')))
+            basic_table.add_row("Region Code", str(basic.get('region_code', 'Unknown')))
             
             self.console.print(basic_table)
             
             # Carrier Information Panel
-            if 'carrier_info' in results:
+            if results.carrier_info:
                 carrier_table = Table(title="📡 Carrier & Location Information", box=box.ROUNDED)
                 carrier_table.add_column("Property", style="cyan", width=20)
                 carrier_table.add_column("Value", style="white", width=50)
                 
-                carrier = results['carrier_info']
+                carrier = results.carrier_info
                 carrier_table.add_row("Carrier", carrier.get('carrier', 'Unknown'))
                 carrier_table.add_row("Location", carrier.get('location', 'Unknown'))
                 carrier_table.add_row("Country", carrier.get('country_name', 'Unknown'))
@@ -636,76 +997,89 @@ class AdvancedPhoneOSINT:
                 self.console.print(carrier_table)
             
             # Format Options Panel
-            if 'formatting' in results:
+            if results.formatting:
                 format_table = Table(title="📋 Number Formats", box=box.ROUNDED)
                 format_table.add_column("Format", style="cyan", width=20)
                 format_table.add_column("Value", style="white", width=50)
                 
-                formats = results['formatting']
+                formats = results.formatting
                 for format_name, format_value in formats.items():
                     format_table.add_row(format_name.title(), format_value)
                 
                 self.console.print(format_table)
             
             # API Results Panel
-            if 'api_results' in results and results['api_results']:
+            if results.api_results and 'skipped' not in results.api_results:
                 api_table = Table(title="🔍 API Lookup Results", box=box.ROUNDED)
                 api_table.add_column("API Source", style="cyan", width=20)
                 api_table.add_column("Status", style="white", width=15)
                 api_table.add_column("Information", style="white", width=35)
                 
-                for api_name, api_result in results['api_results'].items():
+                for api_name, api_result in results.api_results.items():
                     if isinstance(api_result, dict):
                         if 'error' in api_result:
                             api_table.add_row(api_name.title(), "❌ Error", api_result['error'])
                         else:
                             status = "✅ Success"
-                            info = ", ".join([f"{k}: {v}" for k, v in api_result.items() if k != 'status'])
+                            info = ", ".join(f"{k}: {v}" for k, v in api_result.items() if k != 'status')
                             api_table.add_row(api_name.title(), status, info[:50] + "..." if len(info) > 50 else info)
                 
                 self.console.print(api_table)
             
             # Security Analysis Panel
-            if 'security_analysis' in results:
-                security = results['security_analysis']
-                if 'error' not in security:
+            security = results.security_analysis
+            if security:
+                if 'error' not in security and 'skipped' not in security:
+                    risk_style = _RISK_STYLES.get(security['risk_level'], 'green')
+                    risk_factors = ['• ' + factor for factor in security['risk_factors']] or ['• No risk factors detected']
+                    lines = (
+                        "",
+                        "🔒 [bold]Security Analysis[/bold]",
+                        "",
+                        f"Risk Level: [{risk_style}]{security['risk_level'].upper()}[/]",
+                        "",
+                        "Risk Factors:",
+                        *risk_factors,
+                        "",
+                        "Recommendations:",
+                        *('• ' + rec for rec in security['recommendations']),
+                        "",
+                    )
                     security_panel = Panel(
-                        f"""
-🔒 [bold]Security Analysis[/bold]
-
-Risk Level: [{'red' if security['risk_level'] == 'high' else 'yellow' if security['risk_level'] == 'medium' else 'green'}]{security['risk_level'].upper()}[/]
-
-Risk Factors:
-{chr(10).join(['• ' + factor for factor in security['risk_factors']]) if security['risk_factors'] else '• No risk factors detected'}
-
-Recommendations:
-{chr(10).join(['• ' + rec for rec in security['recommendations']])}
-                        """,
+                        '\n'.join(lines),
                         title="🛡️ Security Assessment",
-                        border_style="red" if security['risk_level'] == 'high' else "yellow" if security['risk_level'] == 'medium' else "green"
+                        border_style=risk_style
                     )
                     self.console.print(security_panel)
             
             # Social Media Investigation Panel
-            if 'social_media_searches' in results:
+            if results.social_media_searches and 'skipped' not in results.social_media_searches:
+                social = results.social_media_searches
+                lines = (
+                    "",
+                    "📱 [bold]Social Media Investigation[/bold]",
+                    "",
+                    "Manual verification required for the following platforms:",
+                    "",
+                    *(f"• {platform.title()}: Check manually at generated URL"
+                      for platform in social if platform != 'google_searches'),
+                    "",
+                    "🔍 [bold]Google Search Queries:[/bold]",
+                    *('• ' + query for query in social.get('google_searches', ())),
+                    "",
+                    "[yellow]Note: Manual verification required for accurate social media presence detection[/yellow]",
+                    "",
+                )
                 social_panel = Panel(
-                    f"""
-📱 [bold]Social Media Investigation[/bold]
-
-Manual verification required for the following platforms:
-
-{chr(10).join([f"• {platform.title()}: Check manually at generated URL" for platform in results['social_media_searches'] if platform != 'google_searches'])}
-
-🔍 [bold]Google Search Queries:[/bold]
-{chr(10).join(['• ' + query for query in results['social_media_searches'].get('google_searches', [])])}
-
-[yellow]Note: Manual verification required for accurate social media presence detection[/yellow]
-                    """,
+                    '\n'.join(lines),
                     title="📲 Social Media Analysis",
                     border_style="blue"
                 )
                 self.console.print(social_panel)
             
+            if 'skipped' in results.security_analysis:
+                self.console.print("[yellow]Invalid number: API, social media and security checks were skipped[/yellow]")
+            
         except Exception as e:
             self.console.print(f"[bold red]Error displaying results: {str(e)}[/bold red]")
 
@@ -713,18 +1087,16 @@ Manual verification required for the following platforms:
         """
         Instagram phone number lookup inspired by Toutatis
         """
+        from rich.console import Group
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich import box
+        
         try:
-            self.console.print(f"\n[bold green]📷 Instagram Phone Lookup for {phone_number}[/bold green]")
+            header = f"\n[bold green]📷 Instagram Phone Lookup for {phone_number}[/bold green]"
             
             # Clean phone number
-            clean_number = re.sub(r'[^\d+]', '', phone_number)
-            
-            # Instagram password reset endpoint (for checking if phone is registered)
-            instagram_urls = [
-                'https://www.instagram.com/accounts/password/reset/',
-                'https://i.instagram.com/api/v1/users/lookup/',
-                'https://www.instagram.com/accounts/emailsignup/'
-            ]
+            clean_number = _digits_and_plus(phone_number)
             
             results = {
                 'phone_number': phone_number,
@@ -738,7 +1110,7 @@ Manual verification required for the following platforms:
             # Method 1: Password reset check
             results['search_methods'].append({
                 'method': 'Password Reset Check',
-                'url': instagram_urls[0],
+                'url': _INSTAGRAM_URLS[0],
                 'description': 'Check if phone number is registered via password reset',
                 'manual_required': True
             })
@@ -746,7 +1118,7 @@ Manual verification required for the following platforms:
             # Method 2: Account lookup
             results['search_methods'].append({
                 'method': 'Account Lookup',
-                'url': instagram_urls[1],
+                'url': _INSTAGRAM_URLS[1],
                 'description': 'API-based account lookup (requires session)',
                 'manual_required': True
             })
@@ -754,11 +1126,18 @@ Manual verification required for the following platforms:
             # Method 3: Registration check
             results['search_methods'].append({
                 'method': 'Registration Check',
-                'url': instagram_urls[2],
+                'url': _INSTAGRAM_URLS[2],
                 'description': 'Check if number is available for registration',
                 'manual_required': True
             })
             
+            # Save results
+            self.main_tool.save_result("instagram_phone_lookup", phone_number, results)
+            
+            if not self._wants_rich():
+                self._print_plain(results)
+                return results
+            
             # Display results
             instagram_table = Table(title="📷 Instagram Phone Lookup", box=box.ROUNDED)
             instagram_table.add_column("Method", style="cyan", width=25)
@@ -772,20 +1151,18 @@ Manual verification required for the following platforms:
                     "Manual Required"
                 )
             
-            self.console.print(instagram_table)
-            
             # Instructions panel
             instructions = Panel(
                 f"""
 📋 [bold]Manual Verification Instructions:[/bold]
 
 1. [bold]Password Reset Method:[/bold]
-   • Go to: {instagram_urls[0]}
+   • Go to: {_INSTAGRAM_URLS[0]}
    • Enter phone number: {phone_number}
    • Check if Instagram recognizes the number
 
 2. [bold]Registration Check:[/bold]
-   • Go to: {instagram_urls[2]}
+   • Go to: {_INSTAGRAM_URLS[2]}
    • Try to register with the phone number
    • If it says "number already in use" - account exists
 
@@ -801,10 +1178,8 @@ Real account discovery may require specialized tools and proper authorization.[/
                 border_style="blue"
             )
             
-            self.console.print(instructions)
-            
-            # Save results
-            self.main_tool.save_result("instagram_phone_lookup", phone_number, results)
+            # Render everything in one console write
+            self.console.print(Group(header, instagram_table, instructions))
             
             return results
             
@@ -816,31 +1191,27 @@ Real account discovery may require specialized tools and proper authorization.[/
         """
         Advanced phone reputation analysis
         """
+        from rich.console import Group
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich.text import Text
+        from rich import box
+        
         try:
-            self.console.print(f"\n[bold green]🛡️ Phone Reputation Analysis for {phone_number}[/bold green]")
-            
-            reputation_sources = [
-                'Truecaller Community',
-                'Should I Answer',
-                'Whocalld Database',
-                'Spam Detection APIs',
-                'Reverse Phone Lookup',
-                'Social Media Reports'
-            ]
+            header = f"\n[bold green]🛡️ Phone Reputation Analysis for {phone_number}[/bold green]"
             
             results = {
                 'phone_number': phone_number,
                 'reputation_score': 0,
                 'spam_reports': 0,
                 'category': 'unknown',
-                'sources_checked': reputation_sources,
+                'sources_checked': list(_REPUTATION_SOURCES),
                 'manual_checks': [],
                 'recommendations': []
             }
             
             # Simulate reputation check (in real implementation, would query actual APIs)
-            phone_hash = hashlib.md5(phone_number.encode()).hexdigest()
-            score = int(phone_hash[:2], 16) % 100
+            score = _simulated_score(phone_number)
             
             results['reputation_score'] = score
             results['spam_reports'] = max(0, (100 - score) // 10)
@@ -859,58 +1230,65 @@ Real account discovery may require specialized tools and proper authorization.[/
                 results['recommendations'] = ['High spam risk', 'Likely telemarketer or scammer', 'Recommend blocking']
             
             # Manual check sources
+            stripped = phone_number.replace('+', '')
+            slug = stripped.replace(' ', '-')
             manual_checks = [
-                'https://www.truecaller.com/search/us/' + quote(phone_number),
-                'https://www.shouldianswer.com/phone-number/' + phone_number.replace('+', ''),
-                'https://whocalld.com/+' + phone_number.replace('+', ''),
-                'https://www.whitepages.com/phone/' + phone_number.replace('+', '').replace(' ', '-'),
-                'https://www.spokeo.com/phone-search/' + phone_number.replace('+', '').replace(' ', '-')
+                f'https://www.truecaller.com/search/us/{quote(phone_number)}',
+                f'https://www.shouldianswer.com/phone-number/{stripped}',
+                f'https://whocalld.com/+{stripped}',
+                f'https://www.whitepages.com/phone/{slug}',
+                f'https://www.spokeo.com/phone-search/{slug}'
             ]
             
             results['manual_checks'] = manual_checks
             
+            # Save results
+            self.main_tool.save_result("phone_reputation_analysis", phone_number, results)
+            
+            if not self._wants_rich():
+                self._print_plain(results)
+                return results
+            
             # Display results
             reputation_table = Table(title="🛡️ Phone Reputation Analysis", box=box.ROUNDED)
             reputation_table.add_column("Metric", style="cyan", width=20)
             reputation_table.add_column("Value", style="white", width=30)
             reputation_table.add_column("Description", style="yellow", width=30)
             
-            reputation_table.add_row("Reputation Score", f"{score}/100", "Higher is better")
-            reputation_table.add_row("Category", results['category'].title(), "Risk assessment")
-            reputation_table.add_row("Spam Reports", str(results['spam_reports']), "Estimated reports")
-            reputation_table.add_row("Sources Checked", str(len(reputation_sources)), "Number of databases")
-            
-            self.console.print(reputation_table)
+            rows = (
+                ("Reputation Score", f"{score}/100", "Higher is better"),
+                ("Category", results['category'].title(), "Risk assessment"),
+                ("Spam Reports", str(results['spam_reports']), "Estimated reports"),
+                ("Sources Checked", str(len(_REPUTATION_SOURCES)), "Number of databases"),
+            )
+            for row in rows:
+                reputation_table.add_row(*row)
             
-            # Recommendations panel
+            # Recommendations panel, assembled as styled Text so rich has no
+            # markup to parse
+            recommendations = '\n'.join('• ' + rec for rec in results['recommendations'])
+            category_style = _CATEGORY_STYLES.get(results['category'], 'red')
             recommendations_panel = Panel(
-                f"""
-📊 [bold]Reputation Assessment[/bold]
-
-Category: [{'green' if results['category'] == 'trusted' else 'yellow' if results['category'] == 'neutral' else 'red'}]{results['category'].upper()}[/]
-Score: {score}/100
-
-💡 [bold]Recommendations:[/bold]
-{chr(10).join(['• ' + rec for rec in results['recommendations']])}
-
-🔍 [bold]Manual Verification Sources:[/bold]
-• Truecaller: Check community reports
-• Should I Answer: Spam database lookup
-• Whocalld: Reverse phone lookup
-• White Pages: Official directory
-• Spokeo: People search engine
-
-[yellow]Note: This is a simulated analysis. For accurate reputation data,
-check the manual verification sources listed above.[/yellow]
-                """,
+                Text.assemble(
+                    "\n📊 ", ("Reputation Assessment", "bold"),
+                    "\n\nCategory: ", (results['category'].upper(), category_style),
+                    f"\nScore: {score}/100\n\n💡 ", ("Recommendations:", "bold"),
+                    f"\n{recommendations}\n\n🔍 ", ("Manual Verification Sources:", "bold"),
+                    "\n• Truecaller: Check community reports"
+                    "\n• Should I Answer: Spam database lookup"
+                    "\n• Whocalld: Reverse phone lookup"
+                    "\n• White Pages: Official directory"
+                    "\n• Spokeo: People search engine\n\n",
+                    ("Note: This is a simulated analysis. For accurate reputation data,\n"
+                     "check the manual verification sources listed above.", "yellow"),
+                    "\n"
+                ),
                 title="📈 Reputation Assessment",
-                border_style="green" if results['category'] == 'trusted' else "yellow" if results['category'] == 'neutral' else "red"
+                border_style=category_style
             )
             
-            self.console.print(recommendations_panel)
-            
-            # Save results
-            self.main_tool.save_result("phone_reputation_analysis", phone_number, results)
+            # Render everything in one console write
+            self.console.print(Group(header, reputation_table, recommendations_panel))
             
             return results
             
@@ -922,28 +1300,33 @@ check the manual verification sources listed above.[/yellow]
         """
         Generate various phone number format variations for search
         """
+        from rich.console import Group
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich import box
+        
         try:
-            self.console.print(f"\n[bold green]📝 Phone Number Variations for {phone_number}[/bold green]")
+            header = f"\n[bold green]📝 Phone Number Variations for {phone_number}[/bold green]"
             
             variations = []
             
             # Clean the number
-            clean_number = re.sub(r'[^\d+]', '', phone_number)
-            digits_only = re.sub(r'[^\d]', '', phone_number)
+            clean_number = _digits_and_plus(phone_number)
+            digits_only = _digits_only(phone_number)
             
-            # Parse for proper formatting
+            # Parse for proper formatting; only a parse failure selects the
+            # fallback variations
             try:
-                parsed = phonenumbers.parse(phone_number, None)
+                parsed = _parse_cached(phone_number)
+            except phonenumbers.NumberParseException:
+                parsed = None
+            
+            if parsed is not None:
                 country_code = parsed.country_code
                 national_number = str(parsed.national_number)
                 
                 # Standard formats
-                variations.extend([
-                    phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL),
-                    phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL),
-                    phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
-                    phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.RFC3966),
-                ])
+                variations.extend(_formats_cached(phone_number))
                 
                 # Custom variations
                 variations.extend([
@@ -965,7 +1348,7 @@ check the manual verification sources listed above.[/yellow]
                         f"1-{national_number[:3]}-{national_number[3:6]}-{national_number[6:]}",
                     ])
                 
-            except Exception as e:
+            else:
                 # Fallback variations if parsing fails
                 variations.extend([
                     phone_number,
@@ -973,16 +1356,31 @@ check the manual verification sources listed above.[/yellow]
                     digits_only,
                     phone_number.replace(' ', ''),
                     phone_number.replace('-', ''),
-                    phone_number.replace('(', '').replace(')', ''),
+                    phone_number.translate(_STRIP_PARENS_TABLE),
                 ])
             
-            # Remove duplicates while preserving order
-            unique_variations = []
-            seen = set()
-            for var in variations:
-                if var and var not in seen:
-                    unique_variations.append(var)
-                    seen.add(var)
+            # Remove duplicates and empty entries while preserving order
+            unique_variations = [var for var in dict.fromkeys(variations) if var]
+            
+            results = {
+                'original_number': phone_number,
+                'variations': unique_variations,
+                'total_variations': len(unique_variations),
+                'search_tips': [
+                    "Use quotes for exact matches",
+                    "Combine with names or keywords", 
+                    "Try site-specific searches",
+                    "Check social media platforms",
+                    "Search public records databases"
+                ]
+            }
+            
+            # Save results
+            self.main_tool.save_result("phone_variations", phone_number, results)
+            
+            if not self._wants_rich():
+                self._print_plain(results)
+                return results
             
             # Display variations
             variations_table = Table(title="📝 Phone Number Search Variations", box=box.ROUNDED)
@@ -990,29 +1388,9 @@ check the manual verification sources listed above.[/yellow]
             variations_table.add_column("Format", style="white", width=25)
             variations_table.add_column("Use Case", style="yellow", width=30)
             
-            use_cases = [
-                "International format",
-                "National format", 
-                "E164 standard",
-                "RFC3966 format",
-                "Custom international",
-                "Alternative international",
-                "Dotted format",
-                "Country code prefix",
-                "Minimal format",
-                "Digits only",
-                "Original format",
-                "US formatted",
-                "US dashed",
-                "US dotted",
-                "US with country code"
-            ]
-            
-            for i, var in enumerate(unique_variations[:15]):  # Limit to first 15
-                use_case = use_cases[i] if i < len(use_cases) else "Search variation"
-                variations_table.add_row(str(i+1), var, use_case)
-            
-            self.console.print(variations_table)
+            # zip stops at the last use case, limiting the table to 15 rows
+            for index, (var, use_case) in enumerate(zip(unique_variations, _VARIATION_USE_CASES), 1):
+                variations_table.add_row(str(index), var, use_case)
             
             # Search strategy panel
             search_strategy = Panel(
@@ -1040,23 +1418,8 @@ check the manual verification sources listed above.[/yellow]
                 border_style="blue"
             )
             
-            self.console.print(search_strategy)
-            
-            results = {
-                'original_number': phone_number,
-                'variations': unique_variations,
-                'total_variations': len(unique_variations),
-                'search_tips': [
-                    "Use quotes for exact matches",
-                    "Combine with names or keywords", 
-                    "Try site-specific searches",
-                    "Check social media platforms",
-                    "Search public records databases"
-                ]
-            }
-            
-            # Save results
-            self.main_tool.save_result("phone_variations", phone_number, results)
+            # Render everything in one console write
+            self.console.print(Group(header, variations_table, search_strategy))
             
             return results
             
@@ -1068,6 +1431,24 @@ check the manual verification sources listed above.[/yellow]
         """
         Advanced phone number OSINT menu
         """
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich import box
+        
+        # Menu option -> (handler, phone number prompt or None if it takes no number)
+        phone_prompt = "\n📱 Enter phone number: "
+        actions = {
+            "1": (self.comprehensive_phone_analysis, "\n📱 Enter phone number (with country code): "),
+            "2": (self.instagram_phone_lookup, phone_prompt),
+            "3": (self.phone_reputation_analysis, phone_prompt),
+            "4": (self.generate_phone_variations, phone_prompt),
+            "5": (lambda phone: self._social_media_investigation(phone, self._new_results(phone)), phone_prompt),
+            "6": (self._carrier_deep_analysis, phone_prompt),
+            "7": (self._security_assessment, phone_prompt),
+            "8": (self._batch_phone_analysis, None),
+            "9": (self._export_phone_results, None),
+        }
+        
         while True:
             self.console.clear()
             self.console.print(Panel("[bold cyan]📱 Advanced Phone Number OSINT[/bold cyan]", style="blue"))
@@ -1099,50 +1480,22 @@ check the manual verification sources listed above.[/yellow]
             
             if choice == "0":
                 break
-            elif choice == "1":
-                phone = input("\n📱 Enter phone number (with country code): ").strip()
-                if phone:
-                    self.comprehensive_phone_analysis(phone)
-                    input("\nPress Enter to continue...")
-            elif choice == "2":
-                phone = input("\n📱 Enter phone number: ").strip()
-                if phone:
-                    self.instagram_phone_lookup(phone)
-                    input("\nPress Enter to continue...")
-            elif choice == "3":
-                phone = input("\n📱 Enter phone number: ").strip()
-                if phone:
-                    self.phone_reputation_analysis(phone)
-                    input("\nPress Enter to continue...")
-            elif choice == "4":
-                phone = input("\n📱 Enter phone number: ").strip()
-                if phone:
-                    self.generate_phone_variations(phone)
-                    input("\nPress Enter to continue...")
-            elif choice == "5":
-                phone = input("\n📱 Enter phone number: ").strip()
-                if phone:
-                    self._social_media_investigation(phone, {})
-                    input("\nPress Enter to continue...")
-            elif choice == "6":
-                phone = input("\n📱 Enter phone number: ").strip()
-                if phone:
-                    self._carrier_deep_analysis(phone)
-                    input("\nPress Enter to continue...")
-            elif choice == "7":
-                phone = input("\n📱 Enter phone number: ").strip()
-                if phone:
-                    self._security_assessment(phone)
-                    input("\nPress Enter to continue...")
-            elif choice == "8":
-                self._batch_phone_analysis()
-                input("\nPress Enter to continue...")
-            elif choice == "9":
-                self._export_phone_results()
-                input("\nPress Enter to continue...")
-            else:
+            
+            action = actions.get(choice)
+            if action is None:
                 self.console.print("[red]Invalid option. Please try again.[/red]")
                 time.sleep(1)
+                continue
+            
+            handler, prompt = action
+            if prompt is None:
+                handler()
+            else:
+                phone = input(prompt).strip()
+                if not phone:
+                    continue
+                handler(phone)
+            input("\nPress Enter to continue...")
 
     def _carrier_deep_analysis(self, phone_number):
         """Deep carrier analysis"""
@@ -1156,8 +1509,34 @@ check the manual verification sources listed above.[/yellow]
         
     def _batch_phone_analysis(self):
         """Batch analysis of multiple phone numbers"""
+        from rich.table import Table
+        from rich import box
+        
         self.console.print("\n[bold green]📊 Batch Phone Analysis[/bold green]")
-        # Implementation for batch analysis
+        
+        raw = input("\n📱 Enter phone numbers (comma separated): ").strip()
+        numbers = [number.strip() for number in raw.split(',') if number.strip()]
+        if not numbers:
+            return
+        
+        with self.console.status(f"[bold green]Analyzing {len(numbers)} numbers..."):
+            batch_results = self.comprehensive_phone_batch(numbers)
+        
+        table = Table(title="📊 Batch Results", box=box.ROUNDED)
+        table.add_column("Number", style="cyan")
+        table.add_column("Valid", style="white")
+        table.add_column("Carrier", style="white")
+        table.add_column("Risk Level", style="white")
+        
+        for results in batch_results:
+            table.add_row(
+                results.input_number,
+                "✅ Yes" if results.basic_validation.get('is_valid') else "❌ No",
+                results.carrier_info.get('carrier', 'Unknown'),
+                results.security_analysis.get('risk_level', 'Unknown')
+            )
+        
+        self.console.print(table)
         
     def _export_phone_results(self):
         """Export all phone analysis results"""
@@ -4,6 +4,8 @@ Social Media and Dark Web OSINT Tools
 Advanced social media intelligence gathering
 """
 
+import asyncio
+import hashlib
 import requests
 import json
 import time
@@ -12,12 +14,159 @@ from datetime import datetime
 import subprocess
 from pathlib import Path
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Browser User-Agent for sites that turn away the default requests one
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Profile page fetches are reused for a few minutes so repeated lookups of
+# the same handle in one session skip the HTTP round trip
+PROFILE_CACHE_TTL = 300
+PROFILE_CACHE_SIZE = 1024
+_profile_cache = {}
+
+# Only found / not found answers are cached; rate limits, blocks and
+# server errors are retried on the next lookup
+_CACHEABLE_STATUSES = (200, 404)
+
+def _fetch_profile(session, url, parse, **kwargs):
+    """GET a profile page, returning (status_code, parse(text)) from a TTL cache"""
+    now = time.monotonic()
+    entry = _profile_cache.get(url)
+    if entry is not None and entry[0] > now:
+        return entry[1], entry[2]
+    
+    response = session.get(url, **kwargs)
+    # Keep only the parsed fields, not the page itself
+    fields = parse(response.text) if response.status_code == 200 else None
+    if response.status_code in _CACHEABLE_STATUSES:
+        _profile_cache.pop(url, None)
+        if len(_profile_cache) >= PROFILE_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _profile_cache[next(iter(_profile_cache))]
+        _profile_cache[url] = (now + PROFILE_CACHE_TTL, response.status_code, fields)
+    return response.status_code, fields
+
+# Profile fields scraped from the Twitter page HTML, matched in one pass
+_TW_ALL = re.compile(
+    r'"description":"(?P<bio>[^"]*)"'
+    r'|"followers_count":(?P<followers_count>\d+)'
+    r'|"friends_count":(?P<following_count>\d+)'
+)
+
+def _parse_twitter_profile(content):
+    """Bio and follower/following counts from a Twitter profile page"""
+    # Keep the first occurrence of each field
+    found = {}
+    for match in _TW_ALL.finditer(content):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if len(found) == 3:
+            break
+    
+    fields = {}
+    if "bio" in found:
+        fields["bio"] = found["bio"]
+    for key in ("followers_count", "following_count"):
+        if key in found:
+            fields[key] = int(found[key])
+    return fields
+
+def _parse_instagram_profile(content):
+    """Which profile sections an Instagram page mentions"""
+    fields = {}
+    if 'followers' in content:
+        fields["has_followers_info"] = True
+    if 'posts' in content:
+        fields["has_posts"] = True
+    return fields
+
+# Base58 alphabet used by legacy Bitcoin addresses
+_BTC_CHARS = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BTC_INDEX = {char: index for index, char in enumerate(_BTC_CHARS)}
+
+# Bech32 data alphabet and checksum constants (BIP173 / BIP350)
+_BECH32_CHARS = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_BECH32_INDEX = {char: index for index, char in enumerate(_BECH32_CHARS)}
+_BECH32_CONST = 1
+_BECH32M_CONST = 0x2bc830a3
+
+def _base58check_payload(address):
+    """Decode a Base58Check address, returning its payload or None"""
+    if address.strip(_BTC_CHARS):
+        return None
+    
+    value = 0
+    for char in address:
+        value = value * 58 + _BTC_INDEX[char]
+    
+    # Leading '1's stand for leading zero bytes
+    pad = len(address) - len(address.lstrip('1'))
+    raw = b'\x00' * pad + value.to_bytes((value.bit_length() + 7) // 8, 'big')
+    
+    payload, checksum = raw[:-4], raw[-4:]
+    if hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+        return None
+    return payload
+
+def _bech32_polymod(values):
+    """Bech32 checksum over a sequence of 5-bit values"""
+    generator = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            if (top >> i) & 1:
+                checksum ^= generator[i]
+    return checksum
+
+def _valid_segwit_address(address, hrp="bc"):
+    """Check a Bech32/Bech32m SegWit address checksum and witness program"""
+    if address.lower() != address and address.upper() != address:
+        return False
+    address = address.lower()
+    
+    separator = address.rfind('1')
+    if address[:separator] != hrp or len(address) > 90 or len(address) - separator < 8:
+        return False
+    try:
+        data = [_BECH32_INDEX[char] for char in address[separator + 1:]]
+    except KeyError:
+        return False
+    
+    expanded = [ord(char) >> 5 for char in hrp] + [0] + [ord(char) & 31 for char in hrp]
+    const = _bech32_polymod(expanded + data)
+    version = data[0]
+    if version > 16 or const != (_BECH32_CONST if version == 0 else _BECH32M_CONST):
+        return False
+    
+    # Regroup the 5-bit witness program into bytes
+    acc = bits = 0
+    program = []
+    for value in data[1:-6]:
+        acc = (acc << 5) | value
+        bits += 5
+        if bits >= 8:
+            bits -= 8
+            program.append((acc >> bits) & 0xff)
+    if bits >= 5 or (acc << (8 - bits)) & 0xff:
+        return False
+    if not 2 <= len(program) <= 40:
+        return False
+    return version != 0 or len(program) in (20, 32)
+
 class SocialMediaOSINT:
     def __init__(self, parent):
         self.parent = parent
         self.console = parent.console
         self.config = parent.config
         self.save_result = parent.save_result
+        self.session = parent.session
     
     def twitter_analysis(self, username):
         """Analyze Twitter/X profile"""
@@ -36,24 +185,13 @@ class SocialMediaOSINT:
             
             # Basic profile check
             try:
-                response = requests.get(f"https://twitter.com/{username}", timeout=10)
-                if response.status_code == 200:
+                status_code, fields = _fetch_profile(
+                    self.session, f"https://twitter.com/{username}",
+                    _parse_twitter_profile, timeout=10)
+                if status_code == 200:
                     twitter_info["profile_exists"] = True
-                    # Simple content analysis
-                    content = response.text
-                    
-                    # Extract basic information from HTML (basic scraping)
-                    bio_match = re.search(r'"description":"([^"]*)"', content)
-                    if bio_match:
-                        twitter_info["bio"] = bio_match.group(1)
-                    
-                    followers_match = re.search(r'"followers_count":(\d+)', content)
-                    if followers_match:
-                        twitter_info["followers_count"] = int(followers_match.group(1))
-                    
-                    following_match = re.search(r'"friends_count":(\d+)', content)
-                    if following_match:
-                        twitter_info["following_count"] = int(following_match.group(1))
+                    # Basic information extracted from the HTML
+                    twitter_info.update(fields)
                         
                 else:
                     twitter_info["profile_exists"] = False
@@ -95,22 +233,15 @@ class SocialMediaOSINT:
             
             # Basic profile check
             try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                response = requests.get(f"https://instagram.com/{username}/", 
-                                      headers=headers, timeout=10)
+                status_code, fields = _fetch_profile(
+                    self.session, f"https://instagram.com/{username}/",
+                    _parse_instagram_profile, headers=_BROWSER_HEADERS, timeout=10)
                 
-                if response.status_code == 200:
+                if status_code == 200:
                     instagram_info["profile_exists"] = True
-                    content = response.text
                     
                     # Basic information extraction
-                    if 'followers' in content:
-                        instagram_info["has_followers_info"] = True
-                    
-                    if 'posts' in content:
-                        instagram_info["has_posts"] = True
+                    instagram_info.update(fields)
                         
                 else:
                     instagram_info["profile_exists"] = False
@@ -210,6 +341,7 @@ class DarkWebOSINT:
         self.console = parent.console
         self.config = parent.config
         self.save_result = parent.save_result
+        self.session = parent.session
     
     def dark_web_search_guide(self):
         """Provide dark web search guidance"""
@@ -337,6 +469,7 @@ class CryptoOSINT:
         self.console = parent.console
         self.config = parent.config
         self.save_result = parent.save_result
+        self.session = parent.session
     
     def bitcoin_address_analysis(self, address):
         """Analyze Bitcoin address"""
@@ -360,15 +493,9 @@ class CryptoOSINT:
                     f"https://api.blockcypher.com/v1/btc/main/addrs/{address}/balance"
                 ]
                 
-                for api_url in apis_to_try:
-                    try:
-                        response = requests.get(api_url, timeout=10)
-                        if response.status_code == 200:
-                            data = response.json()
-                            bitcoin_info["blockchain_data"] = data
-                            break
-                    except:
-                        continue
+                data = self._fetch_blockchain_data(apis_to_try)
+                if data is not None:
+                    bitcoin_info["blockchain_data"] = data
                 
             else:
                 bitcoin_info["valid_format"] = False
@@ -407,19 +534,58 @@ class CryptoOSINT:
         from rich.prompt import Prompt
         Prompt.ask("\nPress Enter to continue")
     
+    def _fetch_blockchain_data(self, api_urls):
+        """JSON from the first API in api_urls answering 200, or None"""
+        if aiohttp is not None:
+            return asyncio.run(self._fetch_blockchain_data_async(api_urls))
+        
+        # Without aiohttp, try the APIs one after another
+        for api_url in api_urls:
+            try:
+                response = self.session.get(api_url, timeout=10)
+                if response.status_code == 200:
+                    return response.json()
+            except (requests.RequestException, ValueError):
+                continue
+        return None
+    
+    async def _fetch_blockchain_data_async(self, api_urls):
+        """Race every API concurrently and return the first one answering 200"""
+        async def fetch(session, api_url):
+            async with session.get(api_url) as response:
+                if response.status == 200:
+                    return await response.json(content_type=None)
+                return None
+        
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+            pending = {asyncio.ensure_future(fetch(session, api_url)) for api_url in api_urls}
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if not task.cancelled() and task.exception() is None \
+                                and task.result() is not None:
+                            return task.result()
+            finally:
+                # Drop the slower probes once one has answered
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+        return None
+    
     def validate_bitcoin_address(self, address):
-        """Basic Bitcoin address validation"""
+        """Bitcoin address validation (Base58Check and Bech32 checksums)"""
+        if address[:3].lower() == 'bc1':
+            return _valid_segwit_address(address)
+        
         # Basic format validation
         if len(address) < 26 or len(address) > 35:
             return False
         
-        # Check for valid characters
-        valid_chars = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-        for char in address:
-            if char not in valid_chars:
-                return False
-        
-        return True
+        # Mainnet P2PKH (0x00) or P2SH (0x05) with a 20-byte hash
+        payload = _base58check_payload(address)
+        return payload is not None and len(payload) == 21 and payload[0] in (0x00, 0x05)
     
     def identify_bitcoin_address_type(self, address):
         """Identify Bitcoin address type"""
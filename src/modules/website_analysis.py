@@ -5,30 +5,279 @@ Provides web technology detection, security analysis, and website intelligence
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import re
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 import ssl
 import socket
+import asyncio
+import concurrent.futures
+import functools
 from datetime import datetime
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import track
+from rich.progress import Progress
 from rich.prompt import Prompt, Confirm
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import aiodns
+    _DNS_ERRORS = (aiodns.error.DNSError, socket.gaierror)
+except ImportError:
+    aiodns = None
+    _DNS_ERRORS = (socket.gaierror,)
+
+
+# Technology fingerprints
+_FRAMEWORK_SIGNATURES = {
+    "WordPress": [r'wp-content', r'wp-includes', r'WordPress'],
+    "Drupal": [r'Drupal\.settings', r'sites/default/files'],
+    "Joomla": [r'option=com_', r'Joomla'],
+    "Django": [r'csrfmiddlewaretoken', r'Django'],
+    "Laravel": [r'laravel_session', r'Laravel'],
+    "React": [r'React', r'react', r'_react'],
+    "Angular": [r'ng-', r'angular', r'Angular'],
+    "Vue.js": [r'Vue', r'vue', r'v-'],
+    "Bootstrap": [r'bootstrap', r'Bootstrap'],
+    "jQuery": [r'jquery', r'jQuery']
+}
+
+_JS_SIGNATURES = {
+    "Google Analytics": [r'google-analytics\.com', r'gtag\('],
+    "Google Tag Manager": [r'googletagmanager\.com'],
+    "Facebook Pixel": [r'fbevents\.js', r'facebook\.net'],
+    "Hotjar": [r'hotjar\.com'],
+    "Cloudflare": [r'cloudflare\.com']
+}
+
+# Social network domains, matched with Aho-Corasick when pyahocorasick is
+# installed and with a single alternation regex otherwise
+_SOCIAL_DOMAINS = (
+    'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com',
+    'youtube.com', 'tiktok.com', 'snapchat.com', 'pinterest.com',
+    'reddit.com', 'discord.gg', 'telegram.org', 'whatsapp.com'
+)
+_SOCIAL_RE = re.compile(
+    '|'.join(re.escape(domain) for domain in _SOCIAL_DOMAINS),
+    re.IGNORECASE | re.ASCII
+)
+_SOCIAL_AUTOMATON = None
+if ahocorasick is not None:
+    _SOCIAL_AUTOMATON = ahocorasick.Automaton()
+    for _domain in _SOCIAL_DOMAINS:
+        _SOCIAL_AUTOMATON.add_word(_domain, _domain.split('.')[0].title())
+    _SOCIAL_AUTOMATON.make_automaton()
+
+# Common directories and files to check
+_COMMON_PATHS = (
+    'admin', 'administrator', 'wp-admin', 'login', 'dashboard',
+    'robots.txt', 'sitemap.xml', '.htaccess', '.env',
+    'backup', 'test', 'dev', 'staging', 'api',
+    'uploads', 'images', 'css', 'js', 'assets'
+)
+
+# Common subdomains to check
+_COMMON_SUBDOMAINS = (
+    'www', 'mail', 'ftp', 'admin', 'api', 'dev', 'test', 'staging',
+    'blog', 'shop', 'store', 'm', 'mobile', 'app', 'portal',
+    'support', 'help', 'docs', 'wiki', 'forum', 'community'
+)
+
+# Security headers scored by security_headers_check
+_SECURITY_HEADERS = (
+    'Strict-Transport-Security',
+    'X-Frame-Options',
+    'X-Content-Type-Options',
+    'X-XSS-Protection',
+    'Content-Security-Policy',
+    'Referrer-Policy',
+    'Permissions-Policy'
+)
+
+# Fingerprints and meta tags live in <head> or early <body>, so page
+# analysis only downloads the first 512 KB of the body
+_PAGE_LIMIT = 512 * 1024
+
+# (connect, read) timeouts, so an unresponsive server fails fast on connect
+# without cutting off slow-but-alive pages
+_HTTP_TIMEOUT = (3, 7)
+_PROBE_TIMEOUT = (3, 5)
+
+# Concurrent probes for directory discovery (within the session pool size)
+_DIRECTORY_WORKERS = 20
+
+# Every fingerprint is an escaped ASCII literal, so detection runs on the raw
+# page bytes: a substring check of each unescaped, lowercased signature
+# decides the match without any regex
+_TECH_SIGNATURES = {**_FRAMEWORK_SIGNATURES, **_JS_SIGNATURES}
+_TECH_ANCHORS = {
+    name: tuple(re.sub(r'\\(.)', r'\1', signature).lower().encode() for signature in signatures)
+    for name, signatures in _TECH_SIGNATURES.items()
+}
+
+# <meta name="generator" content="..."> read straight from the page bytes
+_GEN_RE = re.compile(
+    rb'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']*)["\']',
+    re.IGNORECASE
+)
+
+# Optional Hyperscan database over the same fingerprints, one expression
+# per technology, used instead of _TECH_ANCHORS when the bindings are installed
+_TECH_NAMES = list(_TECH_SIGNATURES)
+_TECH_DB = None
+if hyperscan is not None:
+    _TECH_DB = hyperscan.Database()
+    _TECH_DB.compile(
+        expressions=['|'.join(_TECH_SIGNATURES[name]).encode() for name in _TECH_NAMES],
+        ids=list(range(len(_TECH_NAMES))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_TECH_NAMES)
+    )
+
+
+def _detect_technologies(body):
+    """Return the names of all fingerprinted technologies found in a raw page body"""
+    if _TECH_DB is not None:
+        hits = set()
+        _TECH_DB.scan(
+            body,
+            match_event_handler=lambda tech_id, *_: hits.add(_TECH_NAMES[tech_id])
+        )
+        return hits
+    
+    lowered = body.lower()
+    return {
+        name for name, anchors in _TECH_ANCHORS.items()
+        if any(anchor in lowered for anchor in anchors)
+    }
+
+
+def _social_platform(href):
+    """Return the social platform an href points at, or None"""
+    if _SOCIAL_AUTOMATON is not None:
+        for _, platform in _SOCIAL_AUTOMATON.iter(href.lower()):
+            return platform
+        return None
+    
+    match = _SOCIAL_RE.search(href)
+    return match.group(0).split('.')[0].title() if match else None
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context():
+    """Shared client SSL context, so the CA bundle is only loaded once"""
+    return ssl.create_default_context()
+
+
+def _read_body(response):
+    """Read at most _PAGE_LIMIT bytes of a streamed response"""
+    # iter_content decodes the body and wraps mid-body urllib3 errors in
+    # requests exceptions, which raw.read would let through
+    chunks = []
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _PAGE_LIMIT:
+                break
+    finally:
+        response.close()
+    return b''.join(chunks)[:_PAGE_LIMIT]
+
+
+def _read_page(response):
+    """Read at most _PAGE_LIMIT bytes of a streamed response as text"""
+    return _read_body(response).decode(response.encoding or 'utf-8', errors='replace')
+
+
+def _make_soup(markup):
+    """Parse HTML with lxml, falling back to the stdlib parser"""
+    try:
+        return BeautifulSoup(markup, 'lxml')
+    except (FeatureNotFound, ValueError):
+        return BeautifulSoup(markup, 'html.parser')
+
+
+def _extract_page(markup):
+    """Return the title, meta tag attributes and (href, text) anchors of a page"""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(markup)
+        title = tree.css_first('title')
+        return (
+            title.text() if title is not None else None,
+            [node.attributes for node in tree.css('meta')],
+            [(node.attributes.get('href') or '', node.text()) for node in tree.css('a[href]')]
+        )
+    
+    soup = _make_soup(markup)
+    title = soup.find('title')
+    return (
+        title.get_text() if title is not None else None,
+        [tag.attrs for tag in soup.find_all('meta')],
+        [(tag['href'], tag.get_text()) for tag in soup.find_all('a', href=True)]
+    )
+
+
+def _probe_path(session, url):
+    """HEAD a path, retrying as a bodiless GET when the server rejects HEAD"""
+    response = session.head(url, timeout=_PROBE_TIMEOUT, allow_redirects=False)
+    if response.status_code == 405:
+        response = session.get(url, timeout=_PROBE_TIMEOUT, stream=True, allow_redirects=False)
+        response.close()
+    return response
+
 
 class WebsiteAnalysis:
     def __init__(self, console=None, config=None, save_result=None):
         self.console = console or Console()
         self.config = config or {}
         self.save_result = save_result or self._default_save_result
+        
+        # Shared HTTP session so repeated analyses of one host reuse connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=1, backoff_factor=0.1)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': 'KaliOSINT/1.0'})
     
     def _default_save_result(self, title, content):
-        """Default save result function if none provided"""
-        print(f"[SAVE] {title}: {content}")
+        """Default save result function if none provided
+        
+        Custom save_result callbacks receive the same (title, results dict) pair.
+        """
+        if orjson is not None:
+            data = orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            data = json.dumps(content, default=str)
+        print(f"[SAVE] {title}: {data}")
     
     def website_analysis_menu(self):
         """Website analysis submenu"""
@@ -99,7 +348,8 @@ class WebsiteAnalysis:
         }
         
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=_HTTP_TIMEOUT, stream=True)
+            body = _read_body(response)
             results["status_code"] = response.status_code
             results["headers"] = dict(response.headers)
             
@@ -108,52 +358,22 @@ class WebsiteAnalysis:
             results["server_info"]["server"] = server
             self.console.print(f"Server: {server}")
             
-            # Framework detection patterns
-            frameworks = {
-                "WordPress": [r'wp-content', r'wp-includes', r'WordPress'],
-                "Drupal": [r'Drupal\.settings', r'sites/default/files'],
-                "Joomla": [r'option=com_', r'Joomla'],
-                "Django": [r'csrfmiddlewaretoken', r'Django'],
-                "Laravel": [r'laravel_session', r'Laravel'],
-                "React": [r'React', r'react', r'_react'],
-                "Angular": [r'ng-', r'angular', r'Angular'],
-                "Vue.js": [r'Vue', r'vue', r'v-'],
-                "Bootstrap": [r'bootstrap', r'Bootstrap'],
-                "jQuery": [r'jquery', r'jQuery']
-            }
-            
-            content = response.text
-            detected_frameworks = []
-            
-            for framework, patterns in frameworks.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        detected_frameworks.append(framework)
-                        break
+            detected = _detect_technologies(body)
             
-            results["technologies"]["frameworks"] = list(set(detected_frameworks))
+            detected_frameworks = [name for name in _FRAMEWORK_SIGNATURES if name in detected]
+            results["technologies"]["frameworks"] = detected_frameworks
             
             # JavaScript libraries detection
-            js_libs = []
-            js_patterns = {
-                "Google Analytics": r'google-analytics\.com|gtag\(',
-                "Google Tag Manager": r'googletagmanager\.com',
-                "Facebook Pixel": r'fbevents\.js|facebook\.net',
-                "Hotjar": r'hotjar\.com',
-                "Cloudflare": r'cloudflare\.com'
-            }
-            
-            for lib, pattern in js_patterns.items():
-                if re.search(pattern, content, re.IGNORECASE):
-                    js_libs.append(lib)
+            js_libs = [name for name in _JS_SIGNATURES if name in detected]
             
             results["technologies"]["javascript_libraries"] = js_libs
             
             # Meta tag analysis
-            soup = BeautifulSoup(content, 'html.parser')
-            meta_generator = soup.find('meta', attrs={'name': 'generator'})
+            meta_generator = _GEN_RE.search(body)
             if meta_generator:
-                results["technologies"]["generator"] = meta_generator.get('content', '')
+                results["technologies"]["generator"] = meta_generator.group(1).decode(
+                    response.encoding or 'utf-8', errors='replace'
+                )
             
             # Display results
             if detected_frameworks:
@@ -189,40 +409,40 @@ class WebsiteAnalysis:
         
         try:
             # Get SSL certificate
-            context = ssl.create_default_context()
             with socket.create_connection((hostname, port), timeout=10) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
+                with _ssl_context().wrap_socket(sock, server_hostname=hostname) as ssock:
                     cert = ssock.getpeercert()
-                    
-                    results["certificate_info"] = {
-                        "subject": dict(x[0] for x in cert.get('subject', [])),
-                        "issuer": dict(x[0] for x in cert.get('issuer', [])),
-                        "version": cert.get('version'),
-                        "serial_number": cert.get('serialNumber'),
-                        "not_before": cert.get('notBefore'),
-                        "not_after": cert.get('notAfter'),
-                        "alt_names": cert.get('subjectAltName', [])
-                    }
-                    
-                    # Security analysis
                     cipher = ssock.cipher()
-                    if cipher:
-                        results["security_analysis"]["cipher"] = {
-                            "name": cipher[0],
-                            "protocol": cipher[1],
-                            "bits": cipher[2]
-                        }
-                    
-                    # Display key information
-                    subject = results["certificate_info"]["subject"]
-                    issuer = results["certificate_info"]["issuer"]
-                    
-                    self.console.print(f"Subject: {subject.get('commonName', 'Unknown')}")
-                    self.console.print(f"Issuer: {issuer.get('organizationName', 'Unknown')}")
-                    self.console.print(f"Valid until: {cert.get('notAfter')}")
-                    
-                    if cipher:
-                        self.console.print(f"Cipher: {cipher[0]} ({cipher[2]} bits)")
+            
+            # The connection is closed; everything below works on the copies
+            results["certificate_info"] = {
+                "subject": dict(x[0] for x in cert.get('subject', [])),
+                "issuer": dict(x[0] for x in cert.get('issuer', [])),
+                "version": cert.get('version'),
+                "serial_number": cert.get('serialNumber'),
+                "not_before": cert.get('notBefore'),
+                "not_after": cert.get('notAfter'),
+                "alt_names": cert.get('subjectAltName', [])
+            }
+            
+            # Security analysis
+            if cipher:
+                results["security_analysis"]["cipher"] = {
+                    "name": cipher[0],
+                    "protocol": cipher[1],
+                    "bits": cipher[2]
+                }
+            
+            # Display key information
+            subject = results["certificate_info"]["subject"]
+            issuer = results["certificate_info"]["issuer"]
+            
+            self.console.print(f"Subject: {subject.get('commonName', 'Unknown')}")
+            self.console.print(f"Issuer: {issuer.get('organizationName', 'Unknown')}")
+            self.console.print(f"Valid until: {cert.get('notAfter')}")
+            
+            if cipher:
+                self.console.print(f"Cipher: {cipher[0]} ({cipher[2]} bits)")
         
         except Exception as e:
             self.console.print(f"[red]Error analyzing SSL certificate: {e}[/red]")
@@ -247,44 +467,34 @@ class WebsiteAnalysis:
         }
         
         try:
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = self.session.get(url, timeout=_HTTP_TIMEOUT, stream=True)
+            title, meta_tags, links = _extract_page(_read_page(response))
             
             # Basic metadata
-            title = soup.find('title')
-            if title:
-                results["metadata"]["title"] = title.get_text().strip()
+            if title is not None:
+                results["metadata"]["title"] = title.strip()
                 self.console.print(f"Title: {results['metadata']['title']}")
             
-            # Meta tags
-            meta_tags = soup.find_all('meta')
-            for tag in meta_tags:
-                name = tag.get('name') or tag.get('property')
-                content = tag.get('content')
-                if name and content:
-                    results["metadata"][name] = content
-            
-            # Open Graph tags
-            og_tags = soup.find_all('meta', property=lambda x: x and x.startswith('og:'))
-            for tag in og_tags:
-                prop = tag.get('property')
-                content = tag.get('content')
-                if prop and content:
+            # Meta tags, classified in a single pass
+            for attrs in meta_tags:
+                content = attrs.get('content')
+                if not content:
+                    continue
+                
+                name = attrs.get('name')
+                prop = attrs.get('property')
+                if name or prop:
+                    results["metadata"][name or prop] = content
+                
+                # Open Graph and Twitter Card tags
+                if prop and prop.startswith('og:'):
                     results["social_tags"][prop] = content
-            
-            # Twitter Card tags
-            twitter_tags = soup.find_all('meta', attrs={'name': lambda x: x and x.startswith('twitter:')})
-            for tag in twitter_tags:
-                name = tag.get('name')
-                content = tag.get('content')
-                if name and content:
+                if name and name.startswith('twitter:'):
                     results["social_tags"][name] = content
             
             # Extract links
-            links = soup.find_all('a', href=True)
-            for link in links[:20]:  # Limit to first 20 links
-                href = link['href']
-                text = link.get_text().strip()
+            for href, text in links[:20]:  # Limit to first 20 links
+                text = text.strip()
                 if href.startswith(('http://', 'https://')):
                     results["links"].append({"url": href, "text": text})
             
@@ -307,14 +517,6 @@ class WebsiteAnalysis:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        # Common directories and files to check
-        common_paths = [
-            'admin', 'administrator', 'wp-admin', 'login', 'dashboard',
-            'robots.txt', 'sitemap.xml', '.htaccess', '.env',
-            'backup', 'test', 'dev', 'staging', 'api',
-            'uploads', 'images', 'css', 'js', 'assets'
-        ]
-        
         results = {
             "url": url,
             "found_paths": [],
@@ -324,23 +526,48 @@ class WebsiteAnalysis:
         
         base_url = url.rstrip('/')
         
-        for path in track(common_paths, description="Checking paths..."):
-            test_url = f"{base_url}/{path}"
-            results["total_checked"] += 1
+        # Probe all paths concurrently over the shared session
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_DIRECTORY_WORKERS) as executor:
+            future_to_path = {
+                executor.submit(_probe_path, self.session, f"{base_url}/{path}"): path
+                for path in _COMMON_PATHS
+            }
             
-            try:
-                response = requests.get(test_url, timeout=5, allow_redirects=False)
-                if response.status_code in [200, 301, 302, 403]:
-                    results["found_paths"].append({
-                        "path": path,
-                        "url": test_url,
-                        "status_code": response.status_code,
-                        "size": len(response.content)
-                    })
-                    self.console.print(f"✅ Found: /{path} (Status: {response.status_code})")
+            with Progress(console=self.console) as progress:
+                task = progress.add_task("Checking paths...", total=len(future_to_path))
                 
-            except requests.RequestException:
-                pass
+                for future in concurrent.futures.as_completed(future_to_path):
+                    progress.update(task, advance=1)
+                    path = future_to_path[future]
+                    results["total_checked"] += 1
+                    
+                    try:
+                        response = future.result()
+                        if response.status_code in [200, 301, 302, 403]:
+                            content_length = response.headers.get('Content-Length', '')
+                            results["found_paths"].append({
+                                "path": path,
+                                "url": f"{base_url}/{path}",
+                                "status_code": response.status_code,
+                                "size": int(content_length) if content_length.isdigit() else 0
+                            })
+                    
+                    except requests.RequestException:
+                        pass
+        
+        # Report in wordlist order rather than completion order
+        results["found_paths"].sort(key=lambda found: _COMMON_PATHS.index(found["path"]))
+        
+        if results["found_paths"]:
+            table = Table(title="Accessible Paths")
+            table.add_column("Path", style="cyan")
+            table.add_column("Status", style="white")
+            table.add_column("Size", style="white")
+            
+            for found in results["found_paths"]:
+                table.add_row(f"/{found['path']}", str(found["status_code"]), str(found["size"]))
+            
+            self.console.print(table)
         
         self.console.print(f"Checked {results['total_checked']} paths")
         self.console.print(f"Found {len(results['found_paths'])} accessible paths")
@@ -352,13 +579,6 @@ class WebsiteAnalysis:
         """Enumerate subdomains for a domain"""
         self.console.print(f"[bold green]Enumerating subdomains for: {domain}[/bold green]")
         
-        # Common subdomains to check
-        common_subdomains = [
-            'www', 'mail', 'ftp', 'admin', 'api', 'dev', 'test', 'staging',
-            'blog', 'shop', 'store', 'm', 'mobile', 'app', 'portal',
-            'support', 'help', 'docs', 'wiki', 'forum', 'community'
-        ]
-        
         results = {
             "domain": domain,
             "found_subdomains": [],
@@ -366,17 +586,20 @@ class WebsiteAnalysis:
             "analysis_date": datetime.now().isoformat()
         }
         
-        for subdomain in track(common_subdomains, description="Checking subdomains..."):
-            full_domain = f"{subdomain}.{domain}"
-            results["total_checked"] += 1
+        hostnames = [f"{subdomain}.{domain}" for subdomain in _COMMON_SUBDOMAINS]
+        found = asyncio.run(self._resolve_hostnames(hostnames))
+        
+        results["total_checked"] = len(hostnames)
+        results["found_subdomains"] = [hostname for hostname in hostnames if hostname in found]
+        
+        if results["found_subdomains"]:
+            table = Table(title="Active Subdomains")
+            table.add_column("Subdomain", style="cyan")
             
-            try:
-                socket.gethostbyname(full_domain)
-                results["found_subdomains"].append(full_domain)
-                self.console.print(f"✅ Found: {full_domain}")
-                
-            except socket.gaierror:
-                pass
+            for hostname in results["found_subdomains"]:
+                table.add_row(hostname)
+            
+            self.console.print(table)
         
         self.console.print(f"Checked {results['total_checked']} subdomains")
         self.console.print(f"Found {len(results['found_subdomains'])} active subdomains")
@@ -384,6 +607,34 @@ class WebsiteAnalysis:
         self.save_result(f"Subdomain Enumeration - {domain}", results)
         return results
     
+    async def _resolve_hostnames(self, hostnames):
+        """Resolve hostnames concurrently and return the set that exist"""
+        loop = asyncio.get_running_loop()
+        resolver = aiodns.DNSResolver(loop=loop) if aiodns is not None else None
+        
+        async def resolve(hostname):
+            try:
+                if resolver is not None:
+                    await resolver.gethostbyname(hostname, socket.AF_INET)
+                else:
+                    await loop.getaddrinfo(hostname, None, family=socket.AF_INET)
+                return hostname
+            except _DNS_ERRORS:
+                return None
+        
+        found = set()
+        lookups = [resolve(hostname) for hostname in hostnames]
+        with Progress(console=self.console) as progress:
+            task = progress.add_task("Checking subdomains...", total=len(lookups))
+            
+            for lookup in asyncio.as_completed(lookups):
+                hostname = await lookup
+                progress.update(task, advance=1)
+                if hostname:
+                    found.add(hostname)
+        
+        return found
+    
     def security_headers_check(self, url):
         """Check website security headers"""
         self.console.print(f"[bold green]Checking security headers for: {url}[/bold green]")
@@ -391,16 +642,6 @@ class WebsiteAnalysis:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        security_headers = [
-            'Strict-Transport-Security',
-            'X-Frame-Options',
-            'X-Content-Type-Options',
-            'X-XSS-Protection',
-            'Content-Security-Policy',
-            'Referrer-Policy',
-            'Permissions-Policy'
-        ]
-        
         results = {
             "url": url,
             "headers_present": {},
@@ -410,10 +651,10 @@ class WebsiteAnalysis:
         }
         
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=_HTTP_TIMEOUT)
             headers = response.headers
             
-            for header in security_headers:
+            for header in _SECURITY_HEADERS:
                 if header in headers:
                     results["headers_present"][header] = headers[header]
                     results["security_score"] += 1
@@ -423,7 +664,7 @@ class WebsiteAnalysis:
                     self.console.print(f"❌ Missing: {header}")
             
             # Calculate security score as percentage
-            results["security_score"] = (results["security_score"] / len(security_headers)) * 100
+            results["security_score"] = (results["security_score"] / len(_SECURITY_HEADERS)) * 100
             
             self.console.print(f"\nSecurity Score: {results['security_score']:.1f}%")
             
@@ -448,12 +689,6 @@ class WebsiteAnalysis:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        social_domains = [
-            'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com',
-            'youtube.com', 'tiktok.com', 'snapchat.com', 'pinterest.com',
-            'reddit.com', 'discord.gg', 'telegram.org', 'whatsapp.com'
-        ]
-        
         results = {
             "url": url,
             "social_links": [],
@@ -461,23 +696,18 @@ class WebsiteAnalysis:
         }
         
         try:
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all links
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                href = link['href']
-                for domain in social_domains:
-                    if domain in href:
-                        results["social_links"].append({
-                            "platform": domain.split('.')[0].title(),
-                            "url": href,
-                            "text": link.get_text().strip()
-                        })
-                        self.console.print(f"✅ Found {domain.split('.')[0].title()}: {href}")
-                        break
+            response = self.session.get(url, timeout=_HTTP_TIMEOUT)
+            _, _, links = _extract_page(response.text)
+            
+            for href, text in links:
+                platform = _social_platform(href)
+                if platform:
+                    results["social_links"].append({
+                        "platform": platform,
+                        "url": href,
+                        "text": text.strip()
+                    })
+                    self.console.print(f"✅ Found {platform}: {href}")
             
             self.console.print(f"Found {len(results['social_links'])} social media links")
             
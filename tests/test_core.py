@@ -118,6 +118,92 @@ class TestDependencies:
         except ImportError as e:
             pytest.fail(f"Failed to import phonenumbers: {e}")
 
+class TestWebsiteAnalysis:
+    """Test website analysis helpers against canned responses"""
+    
+    class _Response:
+        status_code = 200
+        headers = {'Server': 'nginx'}
+        encoding = 'utf-8'
+        text = (
+            '<html><head><meta name="generator" content="WordPress 6.4">'
+            '<script src="/wp-content/jquery.min.js"></script>'
+            '<script src="https://www.googletagmanager.com/gtm.js"></script>'
+            '</head><body></body></html>'
+        )
+        content = text.encode()
+        
+        def iter_content(self, chunk_size=1):
+            for start in range(0, len(self.content), chunk_size):
+                yield self.content[start:start + chunk_size]
+        
+        def close(self):
+            pass
+    
+    def _analyzer(self, monkeypatch):
+        from modules import website_analysis
+        analyzer = website_analysis.WebsiteAnalysis(save_result=lambda title, content: None)
+        monkeypatch.setattr(analyzer.session, 'get', lambda *a, **k: self._Response())
+        return analyzer
+    
+    def test_tech_stack_detection(self, monkeypatch):
+        """Test framework, library and generator detection"""
+        results = self._analyzer(monkeypatch).website_tech_stack("example.com")
+        technologies = results["technologies"]
+        assert "WordPress" in technologies["frameworks"]
+        assert "jQuery" in technologies["frameworks"]
+        assert "Drupal" not in technologies["frameworks"]
+        assert technologies["javascript_libraries"] == ["Google Tag Manager"]
+        assert technologies["generator"] == "WordPress 6.4"
+
+class TestPhoneQuietMode:
+    """Test that quiet() silences phone analysis output"""
+    
+    class _MainTool:
+        def save_result(self, *args):
+            pass
+    
+    def test_comprehensive_analysis_is_silent(self, capsys):
+        """Test that no spinner, header or table reaches the console"""
+        import io
+        from rich.console import Console
+        from modules.enhanced.phone_osint import AdvancedPhoneOSINT
+        
+        output = io.StringIO()
+        osint = AdvancedPhoneOSINT(self._MainTool())
+        osint.console = Console(file=output, force_terminal=True, record=True)
+        with osint.quiet():
+            results = osint.comprehensive_phone_analysis("+14155552671")
+        
+        assert results is not None
+        assert results.basic_validation["is_valid"]
+        assert output.getvalue() == ""
+        assert osint.console.export_text() == ""
+        assert capsys.readouterr().out == ""
+
+class TestBitcoinValidation:
+    """Test Bitcoin address checksum validation"""
+    
+    def _validate(self, address):
+        from modules.enhanced.social_media import CryptoOSINT
+        return CryptoOSINT.validate_bitcoin_address(None, address)
+    
+    def test_valid_addresses(self):
+        """Test legacy, P2SH, SegWit and Taproot addresses"""
+        assert self._validate("1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa")
+        assert self._validate("3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy")
+        assert self._validate("bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4")
+        assert self._validate("BC1QW508D6QEJXTDG4Y5R3ZARVARY0C5XW7KV8F3T4")
+        assert self._validate("bc1p0xlxvlhemja6c4dqv22uapctqupfhlxm9h8z3k2e72q4k9hcz7vqzk5jj0")
+    
+    def test_invalid_addresses(self):
+        """Test that typos and bad checksums are rejected"""
+        assert not self._validate("1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNb")
+        assert not self._validate("1A1zP1eP5QGefi2DMPTfTL5SLmv7Div0Na")
+        assert not self._validate("bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t5")
+        assert not self._validate("bc1Qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4")
+        assert not self._validate("short")
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v"])